@@ -9,14 +9,243 @@ This script demonstrates the simple caption generation capabilities by:
 """
 
 import os
+import random
 import sys
 import tempfile
 from pathlib import Path
+from unittest import mock
 
 # Add the project root to the path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+# Reference copies of the original loop implementations. The NumPy/Numba
+# versions in SimpleCaptionGenerator must reproduce their output exactly.
+
+def _reference_split_long_segments(caption_segments, max_duration=8.0):
+    """Original per-segment loop of split_long_segments."""
+    split_segments = []
+    for segment in caption_segments:
+        duration = segment['end_time'] - segment['start_time']
+        if duration <= max_duration:
+            split_segments.append(segment)
+            continue
+        words = segment['text'].split()
+        num_words = len(words)
+        num_segments = max(1, int(duration / max_duration))
+        words_per_segment = num_words // num_segments
+        start_time = segment['start_time']
+        segment_duration = duration / num_segments
+        for i in range(num_segments):
+            start_word = i * words_per_segment
+            end_word = start_word + words_per_segment if i < num_segments - 1 else num_words
+            segment_text = ' '.join(words[start_word:end_word])
+            segment_start = start_time + i * segment_duration
+            split_segments.append({
+                'start_time': segment_start,
+                'end_time': segment_start + segment_duration,
+                'text': segment_text,
+                'speaker_id': segment['speaker_id'],
+                'speaker_name': segment['speaker_name'],
+                'confidence': segment['confidence'],
+                'word_count': len(segment_text.split()),
+                'char_count': len(segment_text)
+            })
+    return split_segments
+
+
+def _reference_adjust_timing_for_audio(caption_segments, actual_audio_duration):
+    """Original per-segment copy loop of adjust_timing_for_audio."""
+    if not caption_segments:
+        return []
+    current_duration = max(seg['end_time'] for seg in caption_segments)
+    if current_duration <= 0:
+        return caption_segments
+    scale_factor = actual_audio_duration / current_duration
+    adjusted_segments = []
+    for segment in caption_segments:
+        adjusted_segment = segment.copy()
+        adjusted_segment['start_time'] = segment['start_time'] * scale_factor
+        adjusted_segment['end_time'] = segment['end_time'] * scale_factor
+        adjusted_segments.append(adjusted_segment)
+    return adjusted_segments
+
+
+def _reference_caption_segment(text_segment, start_time, end_time, speaker_mapping):
+    speaker_id = text_segment['speaker_id']
+    speaker_name = speaker_mapping.get(speaker_id, f"Speaker {speaker_id}") if speaker_mapping else f"Speaker {speaker_id}"
+    return {
+        'start_time': start_time,
+        'end_time': end_time,
+        'text': text_segment['text'],
+        'speaker_id': speaker_id,
+        'speaker_name': speaker_name,
+        'confidence': 1.0,
+        'word_count': text_segment['word_count'],
+        'char_count': text_segment['char_count']
+    }
+
+
+def _reference_pad_audio_segments(script_segments, audio_segments):
+    if len(audio_segments) > len(script_segments):
+        return audio_segments[:len(script_segments)]
+    audio_segments = list(audio_segments)
+    while len(audio_segments) < len(script_segments):
+        last_start, last_end = audio_segments[-1]
+        audio_segments.append((last_end, last_end + 1.0))
+    return audio_segments
+
+
+def _reference_audio_alignment(script_segments, audio_segments, speaker_mapping=None):
+    """Original 1:1 mapping of _build_segments_from_audio_alignment."""
+    audio_segments = _reference_pad_audio_segments(script_segments, audio_segments)
+    caption_segments = [
+        _reference_caption_segment(text_segment, start_time, end_time, speaker_mapping)
+        for text_segment, (start_time, end_time) in zip(script_segments, audio_segments)
+    ]
+    if caption_segments and audio_segments:
+        caption_segments[-1]['end_time'] = audio_segments[-1][1]
+    return caption_segments
+
+
+def _reference_audio_alignment_with_word_count(script_segments, audio_segments,
+                                               speaker_mapping=None, audio_duration=0.0):
+    """Original loop of _build_segments_from_audio_alignment_with_word_count."""
+    calibration_offset = 3.0
+    audio_segments = [
+        (max(0.0, start + calibration_offset), min(audio_duration, end + calibration_offset))
+        for start, end in _reference_pad_audio_segments(script_segments, audio_segments)
+    ]
+    total_words = sum(seg['word_count'] for seg in script_segments)
+    total_speech_time = sum(end - start for start, end in audio_segments)
+    
+    caption_segments = []
+    cumulative_audio_time = 0.0
+    for text_segment in script_segments:
+        word_prop = text_segment['word_count'] / total_words if total_words > 0 else 1.0 / len(script_segments)
+        segment_duration = total_speech_time * word_prop
+        target_start_time = cumulative_audio_time
+        target_end_time = cumulative_audio_time + segment_duration
+        
+        actual_start = 0.0
+        actual_end = 0.0
+        audio_time_cursor = 0.0
+        for audio_start, audio_end in audio_segments:
+            audio_dur = audio_end - audio_start
+            if audio_time_cursor <= target_start_time < audio_time_cursor + audio_dur:
+                actual_start = audio_start + (target_start_time - audio_time_cursor)
+            if audio_time_cursor < target_end_time <= audio_time_cursor + audio_dur:
+                actual_end = audio_start + (target_end_time - audio_time_cursor)
+                break
+            audio_time_cursor += audio_dur
+        
+        if actual_end == 0.0:
+            actual_end = min(audio_segments[-1][1], actual_start + segment_duration)
+        actual_start = max(0.0, actual_start + calibration_offset)
+        actual_end = min(audio_duration, actual_end + calibration_offset)
+        cumulative_audio_time += segment_duration
+        caption_segments.append(_reference_caption_segment(text_segment, actual_start, actual_end, speaker_mapping))
+    
+    if caption_segments and audio_segments:
+        caption_segments[-1]['end_time'] = audio_segments[-1][1]
+    return caption_segments
+
+
+def _reference_speech_segments(silences, audio_duration, min_segment_duration):
+    """Original silence-to-speech-segment conversion of _detect_audio_aligned_segments."""
+    speech_segments = []
+    if silences[0][0] > 0:
+        speech_segments.append((0.0, silences[0][0]))
+    for i, (silence_start, silence_end) in enumerate(silences):
+        next_silence_start = silences[i + 1][0] if i + 1 < len(silences) else None
+        if next_silence_start:
+            speech_segments.append((silence_end, next_silence_start))
+        elif silence_end < audio_duration:
+            speech_segments.append((silence_end, audio_duration))
+    if not speech_segments:
+        speech_segments.append((0.0, audio_duration))
+    
+    filtered_segments = []
+    for segment in speech_segments:
+        if segment[1] - segment[0] >= min_segment_duration or not filtered_segments:
+            filtered_segments.append(segment)
+        else:
+            filtered_segments[-1] = (filtered_segments[-1][0], segment[1])
+    
+    i = 0
+    while i < len(filtered_segments) - 1:
+        current_duration = filtered_segments[i][1] - filtered_segments[i][0]
+        next_duration = filtered_segments[i + 1][1] - filtered_segments[i + 1][0]
+        if current_duration < 1.5 and next_duration < 1.5:
+            filtered_segments[i] = (filtered_segments[i][0], filtered_segments[i + 1][1])
+            filtered_segments.pop(i + 1)
+        else:
+            i += 1
+    return filtered_segments
+
+
+def _reference_split_longest(segments, target_count):
+    segments = list(segments)
+    while segments and len(segments) < target_count:
+        max_idx = max(range(len(segments)), key=lambda i: segments[i][1] - segments[i][0])
+        start, end = segments[max_idx]
+        mid = (start + end) / 2.0
+        segments[max_idx] = (start, mid)
+        segments.insert(max_idx + 1, (mid, end))
+    return segments
+
+
+def _reference_merge_smallest_adjacent(segments, target_count):
+    segments = list(segments)
+    while len(segments) > max(target_count, 1):
+        min_idx = min(range(len(segments) - 1),
+                      key=lambda i: (segments[i][1] - segments[i][0]) + (segments[i + 1][1] - segments[i + 1][0]))
+        segments[min_idx] = (segments[min_idx][0], segments[min_idx + 1][1])
+        segments.pop(min_idx + 1)
+    return segments
+
+
+class _FakeFfmpeg:
+    """Stands in for the ffmpeg silencedetect subprocess, replaying its stderr."""
+    
+    def __init__(self, silences):
+        self.returncode = 0
+        self.stderr = ["Input #0, wav, from 'podcast.wav':\n"]
+        for start, end in silences:
+            self.stderr.append(f"[silencedetect @ 0x1] silence_start: {start}\n")
+            self.stderr.append(f"[silencedetect @ 0x1] silence_end: {end} | silence_duration: {end - start}\n")
+    
+    def __call__(self, *args, **kwargs):
+        return self
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+
+def _random_script_segments(rng, count):
+    script_segments = []
+    for _ in range(count):
+        words = [rng.choice(['market', 'rally', 'Q3,', 'earnings.', 'why?', 'a', 'rates'])
+                 for _ in range(rng.randint(0, 40))]
+        text = ' '.join(words)
+        script_segments.append({'speaker_id': rng.randint(0, 3), 'text': text,
+                                'word_count': len(words), 'char_count': len(text)})
+    return script_segments
+
+
+def _random_timeline(rng, count, max_gap=2.0, max_length=12.0):
+    segments = []
+    cursor = 0.0
+    for _ in range(count):
+        start = cursor + rng.uniform(0.0, max_gap)
+        cursor = start + rng.uniform(0.0, max_length)
+        segments.append((start, cursor))
+    return segments
+
+
 def test_simple_caption_generation():
     """Test the simple caption generation functionality."""
     print("🎬 Testing VibeVoice Simple Caption Generation")
@@ -199,6 +428,315 @@ def test_processor_integration():
         print(f"❌ Simple processor integration test failed: {e}")
         return False
 
+def test_vectorized_timing_parity():
+    """Check the vectorized split, alignment and silence paths against the original loops."""
+    print("\n🧮 Testing Vectorized Timing Parity")
+    print("=" * 50)
+    
+    from vibevoice.caption import simple_caption_generator as scg
+    
+    generator = scg.SimpleCaptionGenerator()
+    rng = random.Random(1234)
+    
+    for trial in range(200):
+        script_segments = _random_script_segments(rng, rng.randint(1, 12))
+        audio_segments = _random_timeline(rng, rng.randint(1, 14))
+        if trial % 2:
+            # Snap to a coarse grid so target times land exactly on segment boundaries
+            audio_segments = [(round(start * 2) / 2, round(end * 2) / 2) for start, end in audio_segments]
+        speaker_mapping = rng.choice([None, {0: "Alice", 2: "Carol"}])
+        audio_duration = audio_segments[-1][1] + rng.uniform(-4.0, 2.0)
+        
+        expected = _reference_audio_alignment_with_word_count(
+            script_segments, audio_segments, speaker_mapping, audio_duration)
+        actual = generator._build_segments_from_audio_alignment_with_word_count(
+            script_segments, list(audio_segments), speaker_mapping, audio_duration)
+        assert actual == expected, f"word-count alignment differs (trial {trial})"
+        
+        expected = _reference_audio_alignment(script_segments, audio_segments, speaker_mapping)
+        actual = generator._build_segments_from_audio_alignment(
+            script_segments, list(audio_segments), speaker_mapping)
+        assert actual == expected, f"1:1 alignment differs (trial {trial})"
+        
+        max_duration = rng.uniform(1.0, 9.0)
+        assert generator.split_long_segments(actual, max_duration) == \
+            _reference_split_long_segments(expected, max_duration), f"split differs (trial {trial})"
+        
+        expected_adjusted = _reference_adjust_timing_for_audio(expected, audio_duration)
+        assert generator.adjust_timing_for_audio(actual, audio_duration) == expected_adjusted, \
+            f"timing adjustment differs (trial {trial})"
+        assert generator.adjust_timing_for_audio(actual, audio_duration, inplace=True) is actual
+        assert actual == expected_adjusted, f"in-place timing adjustment differs (trial {trial})"
+    print("✅ Audio alignment, splitting and timing adjustment match the reference loops")
+    
+    for trial in range(200):
+        # Rounded durations make ties between candidate segments likely
+        segments = [(round(start * 2) / 2, round(end * 2) / 2)
+                    for start, end in _random_timeline(rng, rng.randint(1, 20), max_length=4.0)]
+        target_count = rng.randint(1, 30)
+        assert scg._split_longest(segments, target_count) == \
+            _reference_split_longest(segments, target_count), f"split longest differs (trial {trial})"
+        assert scg._merge_smallest_adjacent(segments, target_count) == \
+            _reference_merge_smallest_adjacent(segments, target_count), f"merge differs (trial {trial})"
+    print("✅ Segment count matching matches the reference loops")
+    
+    for trial in range(200):
+        silences = [(round(start, 3), round(end, 3))
+                    for start, end in _random_timeline(rng, rng.randint(1, 15), max_gap=3.0, max_length=1.0)]
+        if rng.random() < 0.2:
+            silences[0] = (0.0, silences[0][1])
+        audio_duration = round(silences[-1][1] + rng.uniform(-0.5, 3.0), 3)
+        expected = _reference_speech_segments(silences, audio_duration, generator.min_detected_segment_duration)
+        
+        with mock.patch.object(scg.shutil, "which", return_value="/usr/bin/ffmpeg"), \
+                mock.patch.object(scg.subprocess, "Popen", _FakeFfmpeg(silences)):
+            actual = generator._detect_audio_aligned_segments("podcast.wav", audio_duration, len(expected))
+        assert actual == expected, f"silence segments differ (trial {trial})"
+    print("✅ Silence-to-speech segment conversion matches the reference loop")
+
+
+def _aligned_share(scg, script_words, transcribed_words, expected):
+    """Share of script words the banded DP kernel aligns to their expected transcript index."""
+    import numpy as np
+    
+    vocab = {}
+    script_ids = np.array([vocab.setdefault(w, len(vocab)) for w in script_words], dtype=np.int32)
+    tx_ids = np.array([vocab.setdefault(w, len(vocab)) for w in transcribed_words], dtype=np.int32)
+    lo, hi = scg._nw_band_limits(script_ids, tx_ids, scg._NW_ALIGN_BAND)
+    aligned = scg._nw_align(script_ids, tx_ids, lo, hi)
+    return sum(1 for i, j in expected.items() if aligned[i] == j) / len(expected)
+
+
+def test_banded_alignment_offsets():
+    """Check that long-script alignment follows transcripts shifted against the script."""
+    print("\n🧭 Testing Banded Alignment With Shifted Transcripts")
+    print("=" * 50)
+    
+    from vibevoice.caption import simple_caption_generator as scg
+    
+    rng = random.Random(7)
+    # Zipf-like word frequencies, so most words repeat and only some are unique
+    script_words = [f"w{int(rng.paretovariate(1.0)) % 3000}" for _ in range(12000)]
+    intro = [f"intro{rng.randrange(10 ** 6)}" for _ in range(500)]
+    cases = {
+        'untranscribed intro': (script_words[500:], {i: i - 500 for i in range(500, 12000)}),
+        'skipped passage': (script_words[:4000] + script_words[4500:],
+                            {i: (i if i < 4000 else i - 500) for i in range(12000) if not 4000 <= i < 4500}),
+        'extra transcript intro': (intro + script_words, {i: i + 500 for i in range(12000)}),
+    }
+    for name, (transcribed_words, expected) in cases.items():
+        share = _aligned_share(scg, script_words, transcribed_words, expected)
+        assert share >= 0.95, f"{name}: only {share:.1%} of script words aligned correctly"
+        print(f"✅ {name}: {share:.1%} of script words aligned correctly")
+    
+    generator = scg.SimpleCaptionGenerator()
+    segments = [script_words[i:i + 100] for i in range(0, len(script_words), 100)]
+    spans = generator._nw_segment_spans(segments, script_words[500:])
+    assert spans is not None and spans[-1] == (11400, 11499), "segment spans do not follow the shifted transcript"
+    
+    unrelated = [f"other{rng.randrange(50)}" for _ in range(12000)]
+    assert generator._nw_segment_spans(segments, unrelated) is None, "poor alignment did not fall back"
+    print("✅ Segment spans follow the shift; a poor alignment falls back to the sequential matcher")
+
+
+def test_boundary_hint_snapping():
+    """Check that silence-aligned boundaries snap to the nearest sentence-start hint within 0.5s."""
+    print("\n📌 Testing Boundary Hint Snapping")
+    print("=" * 50)
+    
+    from vibevoice.caption import simple_caption_generator as scg
+    
+    segments = [(0.0, 3.0), (3.0, 6.0), (6.0, 10.0)]
+    assert scg._snap_to_hints(segments, [3.4]) == [(0.0, 3.4), (3.4, 6.0), (6.0, 10.0)]
+    assert scg._snap_to_hints(segments, [2.6, 6.5]) == [(0.0, 2.6), (2.6, 6.5), (6.5, 10.0)]
+    assert scg._snap_to_hints(segments, [3.6, 5.4]) == segments, "hint beyond 0.5s was snapped"
+    print("✅ Boundaries within 0.5s of a hint move onto it; farther ones stay")
+    
+    # 4.4s is 1.4s from the boundary at 3s and 1.6s from the one at 6s
+    assert scg._snap_to_hints(segments, [4.4], tol=2.0) == [(0.0, 4.4), (4.4, 6.0), (6.0, 10.0)]
+    assert scg._snap_to_hints(segments, [4.6], tol=2.0) == [(0.0, 3.0), (3.0, 4.6), (4.6, 10.0)]
+    print("✅ Each hint moves only the nearest boundary")
+    
+    assert scg._snap_to_hints(segments, []) is segments, "no hints should return the input"
+    single = segments[:1]
+    assert scg._snap_to_hints(single, [0.2]) is single, "a single segment has no boundary to snap"
+    
+    generator = scg.SimpleCaptionGenerator(boundary_hints=[4.8, 2.3])
+    silences = [(2.0, 2.5), (5.0, 5.6)]
+    mapped = generator._map_silences_to_sentences(silences, [], 3, 10.0)
+    assert mapped == [(0.0, 2.3), (2.3, 4.8), (4.8, 10.0)], f"hints not applied: {mapped}"
+    unhinted = scg.SimpleCaptionGenerator()._map_silences_to_sentences(silences, [], 3, 10.0)
+    assert unhinted == [(0.0, 2.0), (2.0, 5.0), (5.0, 10.0)], f"unexpected boundaries: {unhinted}"
+    print("✅ Generator boundary_hints snap the silence-mapped segments; without hints nothing moves")
+
+
+def test_batch_helpers():
+    """Check detect_segments_batch and generate_captions_parallel against their sequential forms."""
+    print("\n🧵 Testing Batch Helpers")
+    print("=" * 50)
+    
+    from vibevoice.caption import simple_caption_generator as scg
+    
+    generator = scg.SimpleCaptionGenerator()
+    assert generator.detect_segments_batch([], [], []) == []
+    
+    silences = [(2.0, 2.5), (5.0, 5.6)]
+    popen = mock.MagicMock(return_value=_FakeFfmpeg(silences))
+    with mock.patch.object(scg.shutil, "which", return_value="/usr/bin/ffmpeg"), \
+            mock.patch.object(scg.subprocess, "Popen", popen):
+        expected = generator._detect_audio_aligned_segments("a.wav", 10.0, 3)
+        single = generator.detect_segments_batch(["a.wav"], [10.0], [3])
+    assert single == [expected], "single-file batch differs from a direct call"
+    command = popen.call_args[0][0]
+    assert command[command.index("-threads") + 1] == "0", "single file should keep ffmpeg's threading"
+    
+    # One silence layout per file; pooled runs must pin ffmpeg to a single thread
+    paths = [f"clip{i}.wav" for i in range(5)] + ["missing.wav"]
+    durations = [6.0 + i for i in range(6)]
+    targets = [2, 3, 4, 3, 2, 3]
+    layouts = {path: [(1.0 + 0.5 * i, 1.4 + 0.5 * i), (3.0, 3.2 + 0.1 * i), (4.5, 5.0)]
+               for i, path in enumerate(paths[:-1])}
+    
+    def fake_popen(cmd, *args, **kwargs):
+        ffmpeg = _FakeFfmpeg(layouts.get(cmd[cmd.index("-i") + 1], []))
+        ffmpeg.returncode = 0 if cmd[cmd.index("-threads") + 1] == "1" else 1
+        return ffmpeg
+    
+    # Pool workers are forked, so they inherit the patches
+    with mock.patch.object(scg.shutil, "which", return_value="/usr/bin/ffmpeg"), \
+            mock.patch.object(scg.subprocess, "Popen", fake_popen):
+        expected = [generator._detect_audio_aligned_segments(path, duration, target, 1)
+                    for path, duration, target in zip(paths, durations, targets)]
+        results = generator.detect_segments_batch(paths, durations, targets, max_workers=3)
+    assert expected[-1] is None and all(expected[:-1]), "unexpected reference detections"
+    assert results == expected, "pooled detection differs from sequential detection"
+    print("✅ detect_segments_batch keeps input order, marks failures None and pins ffmpeg to one thread")
+    
+    rng = random.Random(11)
+    jobs = []
+    for i in range(6):
+        lines = [f"Speaker {rng.randint(0, 2)}: " + " ".join(
+            rng.choice(['Markets', 'rallied', 'today.', 'Why?', 'Rates', 'fell!', 'and'])
+            for _ in range(rng.randint(3, 30))) for _ in range(rng.randint(1, 8))]
+        jobs.append({'script': "\n".join(lines), 'audio_duration': 5.0 + 7 * i,
+                     'speaker_mapping': {0: 'Alice', 1: 'Bob', 2: 'Cara'}})
+    assert generator.generate_captions_parallel([]) == []
+    with mock.patch.object(generator, "_get_whisper_model") as get_model:
+        parallel = generator.generate_captions_parallel(jobs, max_workers=3)
+    assert parallel == [generator.generate_captions_from_script(**job) for job in jobs], \
+        "parallel captions differ from sequential ones"
+    get_model.assert_not_called()
+    
+    path_jobs = [{'script': 'Speaker 0: Hi.', 'audio_duration': 1.0, 'audio_path': f"{i}.wav"} for i in range(4)]
+    with mock.patch.object(scg, "FASTER_WHISPER_AVAILABLE", True), \
+            mock.patch.object(generator, "_get_whisper_model") as get_model, \
+            mock.patch.object(generator, "_generate_captions_job", side_effect=lambda job: job['audio_path']):
+        order = generator.generate_captions_parallel(path_jobs, max_workers=8)
+    assert order == [job['audio_path'] for job in path_jobs], "parallel results out of order"
+    get_model.assert_called_once_with(num_workers=4)
+    print("✅ generate_captions_parallel matches sequential output and loads the shared model once")
+
+
+# Expected output of the original formatter for _FORMAT_SEGMENTS, byte for byte
+_FORMAT_SEGMENTS = [
+    {'start_time': 0.0, 'end_time': 2.4995, 'text': 'Welcome to the show!', 'speaker_id': 0,
+     'speaker_name': 'Alice', 'confidence': 1.0, 'word_count': 4, 'char_count': 20},
+    {'start_time': 59.9996, 'end_time': 3599.9999, 'text': 'Café "naïve" — 東京, 42%?', 'speaker_id': 1,
+     'speaker_name': 'Bob', 'confidence': 0.875, 'word_count': 5, 'char_count': 23},
+    {'start_time': 3661.001, 'end_time': 3725.5, 'text': 'Line one\nline two', 'speaker_id': 0,
+     'speaker_name': 'Alice', 'confidence': 1.0, 'word_count': 4, 'char_count': 17},
+]
+
+_EXPECTED_SRT = (
+    '1\n00:00:00,000 --> 00:00:02,499\n[Alice] Welcome to the show!\n\n'
+    '2\n00:00:59,999 --> 00:59:59,999\n[Bob] Café "naïve" — 東京, 42%?\n\n'
+    '3\n01:01:01,001 --> 01:02:05,500\n[Alice] Line one\nline two\n'
+)
+
+_EXPECTED_VTT = (
+    'WEBVTT\n\n'
+    '00:00:00.000 --> 00:00:02.499\n<v Alice>Welcome to the show!\n\n'
+    '00:00:60.000 --> 00:59:60.000\n<v Bob>Café "naïve" — 東京, 42%?\n\n'
+    '01:01:01.001 --> 01:02:05.500\n<v Alice>Line one\nline two\n'
+)
+
+_EXPECTED_JSON = """{
+  "format": "vibevoice_script_captions",
+  "version": "1.0",
+  "generation_method": "script_based",
+  "segments": [
+    {
+      "start_time": 0.0,
+      "end_time": 2.4995,
+      "text": "Welcome to the show!",
+      "speaker_id": 0,
+      "speaker_name": "Alice",
+      "confidence": 1.0,
+      "word_count": 4,
+      "char_count": 20
+    },
+    {
+      "start_time": 59.9996,
+      "end_time": 3599.9999,
+      "text": "Café \\"naïve\\" — 東京, 42%?",
+      "speaker_id": 1,
+      "speaker_name": "Bob",
+      "confidence": 0.875,
+      "word_count": 5,
+      "char_count": 23
+    },
+    {
+      "start_time": 3661.001,
+      "end_time": 3725.5,
+      "text": "Line one\\nline two",
+      "speaker_id": 0,
+      "speaker_name": "Alice",
+      "confidence": 1.0,
+      "word_count": 4,
+      "char_count": 17
+    }
+  ],
+  "total_segments": 3,
+  "total_duration": 3725.5
+}"""
+
+
+def test_caption_format_output():
+    """Check that SRT, VTT and JSON output is byte-identical to the original formatter."""
+    print("\n📄 Testing Caption Format Output")
+    print("=" * 50)
+    
+    from vibevoice.caption.simple_caption_formatter import SimpleCaptionFormatter
+    
+    formatter = SimpleCaptionFormatter()
+    prepared = formatter.prepare_segments(_FORMAT_SEGMENTS)
+    expected_outputs = {
+        'srt': (formatter.format_srt, _EXPECTED_SRT),
+        'vtt': (formatter.format_vtt, _EXPECTED_VTT),
+        'json': (formatter.format_json, _EXPECTED_JSON),
+    }
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for format_name, (format_fn, expected) in expected_outputs.items():
+            assert format_fn(_FORMAT_SEGMENTS) == expected, f"{format_name} output changed"
+            assert format_fn(prepared) == expected, f"{format_name} output from prepared segments changed"
+            
+            output_path = os.path.join(temp_dir, f"captions.{format_name}")
+            format_fn(_FORMAT_SEGMENTS, output_path)
+            with open(output_path, 'rb') as f:
+                assert f.read() == expected.encode('utf-8'), f"saved {format_name} file changed"
+            print(f"✅ {format_name.upper()} output is byte-identical")
+
+
+def _run_check(check):
+    """Run an assertion-based test, reporting failures instead of raising."""
+    try:
+        check()
+        return True
+    except AssertionError as e:
+        print(f"❌ {e}")
+        return False
+
 def main():
     """Run all simple caption functionality tests."""
     print("🚀 VibeVoice Simple Caption Functionality Test Suite")
@@ -210,14 +748,35 @@ def main():
     # Test 2: Processor integration
     test2_passed = test_processor_integration()
     
+    # Test 3: Vectorized timing matches the original loops
+    test3_passed = _run_check(test_vectorized_timing_parity)
+    
+    # Test 4: Caption files are byte-identical to the original formatter
+    test4_passed = _run_check(test_caption_format_output)
+    
+    # Test 5: Long-script alignment follows shifted transcripts
+    test5_passed = _run_check(test_banded_alignment_offsets)
+    
+    # Test 6: Silence-aligned boundaries snap to sentence-start hints
+    test6_passed = _run_check(test_boundary_hint_snapping)
+    
+    # Test 7: Batch helpers match their sequential forms
+    test7_passed = _run_check(test_batch_helpers)
+    
     # Summary
     print("\n" + "=" * 60)
     print("📊 TEST SUMMARY")
     print("=" * 60)
     print(f"Simple Caption Generation Test: {'✅ PASSED' if test1_passed else '❌ FAILED'}")
     print(f"Simple Processor Integration Test: {'✅ PASSED' if test2_passed else '❌ FAILED'}")
+    print(f"Vectorized Timing Parity Test: {'✅ PASSED' if test3_passed else '❌ FAILED'}")
+    print(f"Caption Format Output Test: {'✅ PASSED' if test4_passed else '❌ FAILED'}")
+    print(f"Banded Alignment Test: {'✅ PASSED' if test5_passed else '❌ FAILED'}")
+    print(f"Boundary Hint Snapping Test: {'✅ PASSED' if test6_passed else '❌ FAILED'}")
+    print(f"Batch Helpers Test: {'✅ PASSED' if test7_passed else '❌ FAILED'}")
     
-    if test1_passed and test2_passed:
+    if (test1_passed and test2_passed and test3_passed and test4_passed and test5_passed
+            and test6_passed and test7_passed):
         print("\n🎉 All tests passed! Simple caption functionality is ready to use.")
         print("\n💡 Next steps:")
         print("   1. Run simple inference: python demo/inference_simple_captions.py")
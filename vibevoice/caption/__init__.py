@@ -5,7 +5,22 @@ This module provides caption generation functionality for VibeVoice audio output
 It includes speech-to-text transcription and caption formatting capabilities.
 """
 
-from .caption_generator import CaptionGenerator
-from .caption_formatter import CaptionFormatter
+import importlib
 
 __all__ = ["CaptionGenerator", "CaptionFormatter"]
+
+# Exported names are imported on first access, so importing a submodule
+# (e.g. simple_caption_generator) does not pull in the Whisper-based generator.
+_LAZY_EXPORTS = {
+    "CaptionGenerator": ".caption_generator",
+    "CaptionFormatter": ".caption_formatter",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,7 +6,10 @@ creating captions that can be used for accessibility and content understanding.
 """
 
 import os
+import shutil
 import logging
+import tempfile
+import threading
 from typing import List, Dict, Any, Optional, Union, Tuple
 import numpy as np
 import torch
@@ -23,10 +26,19 @@ class CaptionGenerator:
     captions with timing information for accessibility and content understanding.
     """
     
+    # faster-whisper's batched pipeline encodes fixed 30s windows at 16 kHz
+    _BATCH_WINDOW = 30 * 16000
+    
+    # Windows per forward pass for transcribe_batch when the batched pipeline is available
+    _DEFAULT_BATCH_SIZE = 8
+    
     def __init__(self, 
                  model_name: str = "base",
                  device: Optional[str] = None,
-                 language: Optional[str] = None):
+                 language: Optional[str] = None,
+                 backend: str = "whisper",
+                 quantize: bool = True,
+                 compute_type: Optional[str] = None):
         """
         Initialize the caption generator.
         
@@ -37,11 +49,26 @@ class CaptionGenerator:
                                    If None, auto-detects best available device.
             language (str, optional): Language code for transcription (e.g., 'en', 'zh').
                                     If None, auto-detects language.
+            backend (str): 'whisper' (openai-whisper), 'faster_whisper' (CTranslate2 with
+                           INT8 weights) or 'openvino' (OpenVINO INT8 IR, CPU only). Falls back
+                           to 'whisper' if the backend's package is not installed.
+            quantize (bool): Run reduced-precision weights when compute_type is not given:
+                             INT8 on CPU, FP16 on CUDA. Default: True.
+            compute_type (str, optional): Explicit weight precision. For faster-whisper any
+                                          CTranslate2 compute type; for openai-whisper 'int8'
+                                          (CPU only), 'float16' or 'float32'.
         """
         self.model_name = model_name
         self.device = device or self._get_best_device()
         self.language = language
+        self.backend = backend
+        self.quantize = quantize
+        self.compute_type = compute_type
         self.model = None
+        self._batched_pipeline = None
+        # Generators are shared between processors and threads; whisper's decoder keeps
+        # per-call kv-cache hooks on the shared modules, so one transcription runs at a time
+        self._model_lock = threading.Lock()
         self._load_model()
         
     def _get_best_device(self) -> str:
@@ -55,10 +82,31 @@ class CaptionGenerator:
     
     def _load_model(self):
         """Load the Whisper model for transcription."""
+        if self.backend == "faster_whisper":
+            try:
+                self._load_faster_whisper_model()
+                return
+            except ImportError:
+                logger.warning("faster-whisper not installed, falling back to openai-whisper. "
+                               "Install it with: pip install faster-whisper")
+                self.backend = "whisper"
+        elif self.backend == "openvino":
+            try:
+                self._load_openvino_model()
+                return
+            except ImportError:
+                logger.warning("optimum-intel not installed, falling back to openai-whisper. "
+                               "Install it with: pip install optimum[openvino]")
+                self.backend = "whisper"
+        
         try:
             import whisper
             logger.info(f"Loading Whisper model '{self.model_name}' on device '{self.device}'")
             self.model = whisper.load_model(self.model_name, device=self.device)
+            self._reduce_whisper_precision()
+            # Inference only: no autograd state on the weights
+            self.model.eval()
+            self.model.requires_grad_(False)
             logger.info("Whisper model loaded successfully")
         except ImportError:
             logger.error("Whisper not installed. Install with: pip install openai-whisper")
@@ -70,10 +118,317 @@ class CaptionGenerator:
             logger.error(f"Failed to load Whisper model: {e}")
             raise
     
+    def _load_faster_whisper_model(self):
+        """Load a CTranslate2 Whisper model with INT8 weights (faster-whisper)."""
+        from faster_whisper import WhisperModel
+        
+        # CTranslate2 runs on CPU or CUDA only
+        device = "cuda" if self.device.startswith("cuda") else "cpu"
+        compute_type = self.compute_type
+        if compute_type is None:
+            if self.quantize:
+                compute_type = "int8_float16" if device == "cuda" else "int8"
+            else:
+                compute_type = "default"
+        logger.info(f"Loading faster-whisper model '{self.model_name}' on device '{device}' ({compute_type})")
+        self.model = WhisperModel(self.model_name, device=device, compute_type=compute_type)
+        logger.info("faster-whisper model loaded successfully")
+    
+    def _load_openvino_model(self):
+        """
+        Load Whisper as an OpenVINO IR with INT8 weights (optimum-intel).
+        
+        The first load exports and quantizes the Hugging Face checkpoint, which can take
+        a long time for large models; the IR is cached under ~/.cache/vibevoice so later
+        processes only read it back.
+        """
+        from optimum.intel.openvino import OVModelForSpeechSeq2Seq
+        from transformers import AutoProcessor, pipeline
+        
+        model_id = self.model_name if "/" in self.model_name else f"openai/whisper-{self.model_name}"
+        cache_root = os.path.expanduser("~/.cache/vibevoice")
+        cache_dir = os.path.join(cache_root, f"ov_whisper_{model_id.replace('/', '--')}")
+        
+        model = None
+        if os.path.isdir(cache_dir):
+            logger.info(f"Loading OpenVINO Whisper IR from '{cache_dir}'")
+            try:
+                model = OVModelForSpeechSeq2Seq.from_pretrained(cache_dir)
+                processor = AutoProcessor.from_pretrained(cache_dir)
+            except Exception as e:
+                # e.g. left behind by an interrupted export; rebuild it
+                logger.warning(f"Discarding unreadable OpenVINO cache '{cache_dir}': {e}")
+                shutil.rmtree(cache_dir, ignore_errors=True)
+                model = None
+        
+        if model is None:
+            logger.info(f"Exporting '{model_id}' to OpenVINO with INT8 weights (first use only)")
+            model = OVModelForSpeechSeq2Seq.from_pretrained(model_id, export=True, load_in_8bit=True)
+            processor = AutoProcessor.from_pretrained(model_id)
+            # Write the IR next to the cache and rename it into place, so an interrupted
+            # export never leaves a partial cache directory behind
+            os.makedirs(cache_root, exist_ok=True)
+            tmp_dir = tempfile.mkdtemp(prefix=f".{os.path.basename(cache_dir)}.", dir=cache_root)
+            try:
+                model.save_pretrained(tmp_dir)
+                processor.save_pretrained(tmp_dir)
+                os.replace(tmp_dir, cache_dir)
+            except Exception as e:
+                # e.g. another process cached the same model first; the loaded model still works
+                logger.warning(f"Could not cache the OpenVINO IR at '{cache_dir}': {e}")
+            finally:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        
+        self.model = pipeline(
+            "automatic-speech-recognition",
+            model=model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+            chunk_length_s=30
+        )
+        logger.info("OpenVINO Whisper model loaded successfully")
+    
+    def _transcribe_openvino(self, audio: Union[str, np.ndarray], word_timestamps: bool = False,
+                             batch_size: int = 1) -> Dict[str, Any]:
+        """Run the OpenVINO pipeline and adapt its chunks to the openai-whisper result layout."""
+        generate_kwargs = {"language": self.language} if self.language else {}
+        output = self.model(audio, return_timestamps=True, batch_size=batch_size,
+                            generate_kwargs=generate_kwargs)
+        
+        result_segments = []
+        for i, chunk in enumerate(output.get('chunks', [])):
+            start, end = chunk['timestamp']
+            result_segments.append({
+                'id': i,
+                'start': start,
+                'end': end if end is not None else start,
+                'text': chunk['text'],
+                'words': []
+            })
+        
+        if word_timestamps and result_segments:
+            # Word timing is a separate decode; attach each word to the segment it starts in
+            words = self.model(audio, return_timestamps="word", batch_size=batch_size,
+                               generate_kwargs=generate_kwargs).get('chunks', [])
+            segment_index = 0
+            for word in words:
+                start, end = word['timestamp']
+                while (segment_index + 1 < len(result_segments)
+                       and start >= result_segments[segment_index + 1]['start']):
+                    segment_index += 1
+                result_segments[segment_index]['words'].append({
+                    'word': word['text'],
+                    'start': start,
+                    'end': end if end is not None else start,
+                    'probability': 1.0
+                })
+        
+        return {
+            'text': output['text'],
+            'language': self.language or 'unknown',
+            'segments': result_segments
+        }
+    
+    def _reduce_whisper_precision(self):
+        """Quantize Linear layers to INT8 (CPU) or cast to FP16 (CUDA) on an openai-whisper model."""
+        compute_type = self.compute_type
+        if compute_type is None:
+            if not self.quantize:
+                return
+            if self.device == "cpu":
+                compute_type = "int8"
+            elif self.device.startswith("cuda"):
+                compute_type = "float16"
+            else:
+                return
+        
+        if compute_type == "int8":
+            if self.device != "cpu":
+                logger.warning(f"INT8 dynamic quantization is CPU-only, keeping FP32 on '{self.device}'")
+                return
+            self._use_plain_linears()
+            self.model = torch.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+        elif compute_type == "float16":
+            self.model = self.model.half()
+            # whisper's LayerNorm runs in FP32 (it calls super().forward(x.float())), so its
+            # weights must stay FP32; Linear and Conv1d cast their weights to the input dtype
+            for module in self.model.modules():
+                if isinstance(module, torch.nn.LayerNorm):
+                    module.float()
+        elif compute_type != "float32":
+            logger.warning(f"Unsupported compute type '{compute_type}' for openai-whisper, keeping FP32")
+            return
+        logger.info(f"Whisper model running with {compute_type} weights")
+    
+    def _use_plain_linears(self):
+        """
+        Replace whisper's Linear subclass with nn.Linear modules sharing its parameters.
+        
+        quantize_dynamic only swaps modules whose type is exactly nn.Linear. whisper's
+        subclass differs only in forward(), which calls F.linear with the weight and bias
+        cast to the input dtype; for the FP32 inputs used on CPU that cast is a no-op, so
+        nn.Linear computes the same result.
+        """
+        for parent in list(self.model.modules()):
+            for name, child in list(parent.named_children()):
+                if isinstance(child, torch.nn.Linear) and type(child) is not torch.nn.Linear:
+                    linear = torch.nn.Linear(child.in_features, child.out_features,
+                                             bias=child.bias is not None, device="meta")
+                    linear.weight = child.weight
+                    if child.bias is not None:
+                        linear.bias = child.bias
+                    setattr(parent, name, linear)
+    
+    def _upload_audio(self, audio: Union[str, np.ndarray]) -> torch.Tensor:
+        """
+        Move 16 kHz audio to the model's GPU through pinned host memory.
+        
+        openai-whisper computes the log-mel spectrogram on whatever device the audio
+        is on; handing it a CUDA tensor keeps the STFT and every 30s mel window on the
+        GPU instead of copying each window host-to-device from pageable memory.
+        """
+        if isinstance(audio, str):
+            from whisper.audio import load_audio
+            audio = load_audio(audio)
+        # pin_memory() draws from torch's caching host allocator, so repeat calls reuse buffers
+        pinned = torch.from_numpy(np.ascontiguousarray(audio, dtype=np.float32)).pin_memory()
+        return pinned.to(self.device, non_blocking=True)
+    
+    def _get_batched_pipeline(self):
+        """faster-whisper's batched pipeline over the loaded model, or None if unavailable (< 1.1)."""
+        if self._batched_pipeline is None:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                return None
+            self._batched_pipeline = BatchedInferencePipeline(model=self.model)
+        return self._batched_pipeline
+    
+    def _transcribe(self, audio: Union[str, np.ndarray], word_timestamps: bool = False,
+                    batch_size: int = 1) -> Dict[str, Any]:
+        """
+        Run the loaded model and return an openai-whisper style result.
+        
+        faster-whisper output is adapted to the same {'text', 'language', 'segments'}
+        layout (segments as dicts, words under 'words') so callers are backend-agnostic.
+        With batch_size > 1, faster-whisper encodes batch_size 30s windows per forward pass.
+        Calls from different threads are serialized on the generator's model lock.
+        """
+        with self._model_lock:
+            return self._transcribe_locked(audio, word_timestamps=word_timestamps, batch_size=batch_size)
+    
+    def _transcribe_locked(self, audio: Union[str, np.ndarray], word_timestamps: bool,
+                           batch_size: int) -> Dict[str, Any]:
+        """_transcribe's body; the caller holds _model_lock."""
+        if self.backend == "openvino":
+            return self._transcribe_openvino(audio, word_timestamps=word_timestamps, batch_size=batch_size)
+        
+        if self.backend != "faster_whisper":
+            if self.device.startswith("cuda"):
+                audio = self._upload_audio(audio)
+            with torch.inference_mode():
+                return self.model.transcribe(
+                    audio,
+                    language=self.language,
+                    word_timestamps=word_timestamps,
+                    verbose=False
+                )
+        
+        pipeline = self._get_batched_pipeline() if batch_size > 1 else None
+        if pipeline is not None:
+            from faster_whisper import decode_audio
+            
+            if isinstance(audio, str):
+                audio = decode_audio(audio)
+            # The pipeline defaults to VAD chunking without timestamp tokens, which moves
+            # segment boundaries; keep sequential-style timestamps over fixed 30s windows
+            window = self._BATCH_WINDOW
+            clip_timestamps = [{'start': start, 'end': min(start + window, len(audio))}
+                               for start in range(0, len(audio), window)]
+            segments, info = pipeline.transcribe(audio, language=self.language,
+                                                 word_timestamps=word_timestamps, batch_size=batch_size,
+                                                 without_timestamps=False, vad_filter=False,
+                                                 clip_timestamps=clip_timestamps)
+        else:
+            segments, info = self.model.transcribe(audio, language=self.language,
+                                                   word_timestamps=word_timestamps)
+        # faster-whisper decodes lazily, as segments is consumed here under the lock
+        result_segments = [self._segment_to_dict(i, segment) for i, segment in enumerate(segments)]
+        
+        return {
+            'text': ''.join(segment['text'] for segment in result_segments),
+            'language': info.language,
+            'segments': result_segments
+        }
+    
+    @staticmethod
+    def _segment_to_dict(index: int, segment, offset: float = 0.0, limit: float = float("inf")) -> Dict[str, Any]:
+        """An openai-whisper style dict for a faster-whisper segment, shifted back by offset seconds."""
+        return {
+            'id': index,
+            'start': min(segment.start - offset, limit),
+            'end': min(segment.end - offset, limit),
+            'text': segment.text,
+            'avg_logprob': segment.avg_logprob,
+            'no_speech_prob': segment.no_speech_prob,
+            'words': [
+                {'word': word.word, 'start': min(word.start - offset, limit),
+                 'end': min(word.end - offset, limit), 'probability': word.probability}
+                for word in (segment.words or [])
+            ]
+        }
+    
+    def _transcribe_many(self, audios: List[Union[str, np.ndarray]], batch_size: int) -> List[Dict[str, Any]]:
+        """
+        Transcribe several audio files or 16 kHz arrays in one batched faster-whisper pass.
+        
+        Each array is cut into 30s windows and its last window is zero-padded to 30s,
+        as Whisper pads it anyway, so windows never span two files and the encoder
+        batches windows from different files together. Returns one _transcribe-style
+        result per array.
+        """
+        window = self._BATCH_WINDOW
+        if any(isinstance(audio, str) for audio in audios):
+            from faster_whisper import decode_audio
+            audios = [decode_audio(audio) if isinstance(audio, str) else audio for audio in audios]
+        window_counts = [-(-len(audio) // window) for audio in audios]
+        buffer = np.zeros(sum(window_counts) * window, dtype=np.float32)
+        window_owner = np.repeat(np.arange(len(audios)), window_counts)
+        first_window = np.concatenate(([0], np.cumsum(window_counts)))
+        for audio, start in zip(audios, first_window[:-1]):
+            buffer[start * window:start * window + len(audio)] = audio
+        
+        results = [{'text': '', 'language': self.language or 'unknown', 'segments': []} for _ in audios]
+        if buffer.size == 0:
+            return results
+        clip_timestamps = [{'start': start, 'end': start + window} for start in range(0, buffer.size, window)]
+        
+        with self._model_lock:
+            segments, info = self._get_batched_pipeline().transcribe(
+                buffer, language=self.language, batch_size=batch_size,
+                without_timestamps=False, vad_filter=False, clip_timestamps=clip_timestamps
+            )
+            for segment in segments:
+                # A segment lies inside one window; its midpoint names the window
+                k = min(int((segment.start + segment.end) / 2 * 16000) // window, len(window_owner) - 1)
+                owner = int(window_owner[k])
+                offset = int(first_window[owner]) * window / 16000
+                limit = len(audios[owner]) / 16000
+                if segment.start - offset >= limit:
+                    continue  # decoded from the zero padding
+                owner_segments = results[owner]['segments']
+                owner_segments.append(self._segment_to_dict(len(owner_segments), segment, offset, limit))
+        
+        for result in results:
+            result['text'] = ''.join(segment['text'] for segment in result['segments'])
+            result['language'] = info.language
+        return results
+    
     def transcribe_audio(self, 
                         audio_path: str,
                         return_timestamps: bool = True,
-                        return_word_timestamps: bool = False) -> Dict[str, Any]:
+                        return_word_timestamps: bool = False,
+                        batch_size: int = 1) -> Dict[str, Any]:
         """
         Transcribe audio file to text with optional timing information.
         
@@ -81,6 +436,7 @@ class CaptionGenerator:
             audio_path (str): Path to the audio file to transcribe.
             return_timestamps (bool): Whether to include segment timestamps.
             return_word_timestamps (bool): Whether to include word-level timestamps.
+            batch_size (int): 30s windows encoded per forward pass (faster-whisper backend only).
             
         Returns:
             Dict[str, Any]: Transcription result containing:
@@ -96,12 +452,7 @@ class CaptionGenerator:
         
         try:
             # Transcribe with Whisper
-            result = self.model.transcribe(
-                audio_path,
-                language=self.language,
-                word_timestamps=return_word_timestamps,
-                verbose=False
-            )
+            result = self._transcribe(audio_path, word_timestamps=return_word_timestamps, batch_size=batch_size)
             
             # Extract basic information
             transcription_result = {
@@ -125,10 +476,86 @@ class CaptionGenerator:
             logger.error(f"Transcription failed: {e}")
             raise
     
+    def transcribe_batch(self,
+                         audio_paths: Optional[List[str]],
+                         return_timestamps: bool = True,
+                         batch_size: Optional[int] = None,
+                         audio_arrays: Optional[List[np.ndarray]] = None,
+                         sample_rate: int = 24000) -> List[Dict[str, Any]]:
+        """
+        Transcribe several audio files.
+        
+        With the faster-whisper backend and batch_size > 1, the 30s windows of all files
+        go through the encoder batch_size at a time, so many short files share forward
+        passes. Windows are cut at fixed 30s boundaries, so a word spanning one can be
+        split, and unless a language was set it is detected once for the whole batch.
+        Other backends transcribe the files one after another.
+        
+        Args:
+            audio_paths (List[str]): Paths to the audio files to transcribe; may be None
+                                     when audio_arrays is given.
+            return_timestamps (bool): Whether to include segment timestamps.
+            batch_size (int, optional): Windows encoded per forward pass (faster-whisper backend
+                              only). Default: _DEFAULT_BATCH_SIZE when faster-whisper's batched
+                              pipeline is available, otherwise 1 (sequential decoding).
+            audio_arrays (List[np.ndarray], optional): In-memory audio matching audio_paths
+                (e.g. what was just written there); transcribed instead of decoding the files.
+            sample_rate (int): Sample rate of audio_arrays.
+            
+        Returns:
+            List[Dict[str, Any]]: One transcription result per file (see transcribe_audio).
+        """
+        pipeline = self._get_batched_pipeline() if self.backend == "faster_whisper" else None
+        if batch_size is None:
+            batch_size = self._DEFAULT_BATCH_SIZE if pipeline is not None else 1
+        
+        if pipeline is None or batch_size <= 1:
+            if audio_arrays is not None:
+                return [
+                    self.transcribe_audio_array(audio_array, sample_rate=sample_rate,
+                                                return_timestamps=return_timestamps, batch_size=batch_size)
+                    for audio_array in audio_arrays
+                ]
+            return [
+                self.transcribe_audio(audio_path, return_timestamps=return_timestamps, batch_size=batch_size)
+                for audio_path in audio_paths
+            ]
+        
+        if audio_arrays is not None:
+            logger.info(f"Transcribing {len(audio_arrays)} audio arrays in batches of {batch_size} windows")
+            audios = [self._prepare_audio_array(audio_array, sample_rate) for audio_array in audio_arrays]
+            durations = [len(audio_array) / sample_rate for audio_array in audio_arrays]
+        else:
+            for audio_path in audio_paths:
+                if not os.path.exists(audio_path):
+                    raise FileNotFoundError(f"Audio file not found: {audio_path}")
+            logger.info(f"Transcribing {len(audio_paths)} audio files in batches of {batch_size} windows")
+            audios = list(audio_paths)
+            durations = [self._get_audio_duration(audio_path) for audio_path in audio_paths]
+        
+        try:
+            results = self._transcribe_many(audios, batch_size)
+        except Exception as e:
+            logger.error(f"Batch transcription failed: {e}")
+            raise
+        
+        transcriptions = []
+        for result, duration in zip(results, durations):
+            transcription_result = {
+                'text': result['text'].strip(),
+                'language': result.get('language', 'unknown'),
+                'duration': duration
+            }
+            if return_timestamps:
+                transcription_result['segments'] = result['segments']
+            transcriptions.append(transcription_result)
+        return transcriptions
+    
     def transcribe_audio_array(self, 
                               audio_array: np.ndarray,
                               sample_rate: int = 24000,
-                              return_timestamps: bool = True) -> Dict[str, Any]:
+                              return_timestamps: bool = True,
+                              batch_size: int = 1) -> Dict[str, Any]:
         """
         Transcribe audio array directly without saving to file.
         
@@ -136,6 +563,7 @@ class CaptionGenerator:
             audio_array (np.ndarray): Audio data as numpy array.
             sample_rate (int): Sample rate of the audio data.
             return_timestamps (bool): Whether to include segment timestamps.
+            batch_size (int): 30s windows encoded per forward pass (faster-whisper backend only).
             
         Returns:
             Dict[str, Any]: Transcription result (same format as transcribe_audio).
@@ -143,20 +571,8 @@ class CaptionGenerator:
         logger.info(f"Transcribing audio array with shape {audio_array.shape}")
         
         try:
-            # Whisper expects audio as float32 in range [-1, 1]
-            if audio_array.dtype != np.float32:
-                audio_array = audio_array.astype(np.float32)
-            
-            # Normalize if needed
-            if np.max(np.abs(audio_array)) > 1.0:
-                audio_array = audio_array / np.max(np.abs(audio_array))
-            
             # Transcribe directly
-            result = self.model.transcribe(
-                audio_array,
-                language=self.language,
-                verbose=False
-            )
+            result = self._transcribe(self._prepare_audio_array(audio_array, sample_rate), batch_size=batch_size)
             
             # Extract information
             transcription_result = {
@@ -175,6 +591,33 @@ class CaptionGenerator:
             logger.error(f"Array transcription failed: {e}")
             raise
     
+    @classmethod
+    def _prepare_audio_array(cls, audio_array: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Convert in-memory audio to the float32 16 kHz [-1, 1] input Whisper expects."""
+        # Whisper expects audio as float32 in range [-1, 1]
+        if audio_array.dtype != np.float32:
+            audio_array = audio_array.astype(np.float32)
+        
+        # Normalize if needed
+        if np.max(np.abs(audio_array)) > 1.0:
+            audio_array = audio_array / np.max(np.abs(audio_array))
+        
+        return cls._resample_for_model(audio_array, sample_rate)
+    
+    @staticmethod
+    def _resample_for_model(audio_array: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Resample to the 16 kHz both Whisper backends assume for in-memory audio."""
+        if sample_rate == 16000:
+            return audio_array
+        try:
+            import librosa
+            return librosa.resample(audio_array, orig_sr=sample_rate, target_sr=16000)
+        except ImportError:
+            from math import gcd
+            from scipy.signal import resample_poly
+            factor = gcd(sample_rate, 16000)
+            return resample_poly(audio_array, 16000 // factor, sample_rate // factor).astype(np.float32)
+    
     def _extract_word_timestamps(self, whisper_result: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract word-level timestamps from Whisper result."""
         word_timestamps = []
@@ -205,7 +648,8 @@ class CaptionGenerator:
     def generate_captions_for_script(self, 
                                    audio_path: str,
                                    original_script: str,
-                                   speaker_mapping: Optional[Dict[int, str]] = None) -> Dict[str, Any]:
+                                   speaker_mapping: Optional[Dict[int, str]] = None,
+                                   transcription: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Generate captions with speaker identification based on original script.
         
@@ -213,6 +657,8 @@ class CaptionGenerator:
             audio_path (str): Path to generated audio file.
             original_script (str): Original script used for generation.
             speaker_mapping (Dict[int, str], optional): Mapping of speaker IDs to names.
+            transcription (Dict[str, Any], optional): Existing transcribe_audio result for
+                audio_path (e.g. from transcribe_batch); transcribed here if None.
             
         Returns:
             Dict[str, Any]: Caption result with speaker identification.
@@ -220,7 +666,8 @@ class CaptionGenerator:
         logger.info("Generating captions with speaker identification")
         
         # Transcribe the audio
-        transcription = self.transcribe_audio(audio_path, return_timestamps=True)
+        if transcription is None:
+            transcription = self.transcribe_audio(audio_path, return_timestamps=True)
         
         # Parse original script to get speaker information
         script_segments = self._parse_script_segments(original_script)
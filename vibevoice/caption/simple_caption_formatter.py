@@ -7,12 +7,42 @@ focusing on clean, readable output without requiring speech-to-text.
 
 import os
 import logging
-from typing import List, Dict, Any, Optional, Union
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Union, Tuple, Iterable, Iterator, TextIO
 from datetime import timedelta
 
 logger = logging.getLogger(__name__)
 
 
+def _newline_joined(lines: Iterable[str]) -> Iterator[str]:
+    """Yield lines with newlines between them, matching "\n".join(lines) chunk by chunk."""
+    it = iter(lines)
+    yield next(it, "")
+    for line in it:
+        yield "\n" + line
+
+
+@dataclass
+class PreparedCaptions:
+    """
+    Caption segments with their display fields formatted once.
+    
+    Returned by SimpleCaptionFormatter.prepare_segments and accepted by every
+    format_* method in place of the segment list, so writing several formats
+    reuses the same timestamp strings and stripped text.
+    """
+    segments: List[Dict[str, Any]]
+    texts: List[str]
+    speakers: List[str]
+    start_times: List[float]
+    end_times: List[float]
+    srt_starts: List[str]
+    srt_ends: List[str]
+    vtt_starts: List[str]
+    vtt_ends: List[str]
+    readable_starts: List[str]
+
+
 class SimpleCaptionFormatter:
     """
     Formats script-based captions into various subtitle and caption formats.
@@ -24,25 +54,63 @@ class SimpleCaptionFormatter:
         """Initialize the simple caption formatter."""
         pass
     
-    def format_srt(self, caption_segments: List[Dict[str, Any]], 
-                   output_path: Optional[str] = None) -> str:
+    def prepare_segments(self, caption_segments: Union[List[Dict[str, Any]], PreparedCaptions]) -> PreparedCaptions:
+        """
+        Format timestamps and text for all segments in one pass.
+        
+        Args:
+            caption_segments (Union[List[Dict[str, Any]], PreparedCaptions]): Caption segments with timing.
+            
+        Returns:
+            PreparedCaptions: Preformatted segments (returned as-is if already prepared).
+        """
+        if isinstance(caption_segments, PreparedCaptions):
+            return caption_segments
+        
+        prepared = PreparedCaptions(caption_segments, [], [], [], [], [], [], [], [], [])
+        for segment in caption_segments:
+            start_time = segment.get('start_time', 0.0)
+            end_time = segment.get('end_time', 0.0)
+            srt_start, vtt_start = self._format_srt_vtt_times(start_time)
+            srt_end, vtt_end = self._format_srt_vtt_times(end_time)
+            
+            prepared.texts.append(segment.get('text', '').strip())
+            prepared.speakers.append(segment.get('speaker_name', ''))
+            prepared.start_times.append(start_time)
+            prepared.end_times.append(end_time)
+            prepared.srt_starts.append(srt_start)
+            prepared.srt_ends.append(srt_end)
+            prepared.vtt_starts.append(vtt_start)
+            prepared.vtt_ends.append(vtt_end)
+            prepared.readable_starts.append(self._format_readable_time(start_time))
+        
+        return prepared
+    
+    def format_srt(self, caption_segments: Union[List[Dict[str, Any]], PreparedCaptions], 
+                   output_path: Optional[str] = None,
+                   file: Optional[TextIO] = None) -> str:
         """
         Format captions as SRT (SubRip) subtitle file.
         
         Args:
-            caption_segments (List[Dict[str, Any]]): List of caption segments with timing.
+            caption_segments (Union[List[Dict[str, Any]], PreparedCaptions]): Caption segments with timing.
             output_path (str, optional): Path to save SRT file. If None, returns content as string.
+            file (TextIO, optional): Open text file to write to instead of opening output_path.
             
         Returns:
             str: SRT content or path to saved file.
         """
-        srt_content = []
+        lines = self._srt_lines(self.prepare_segments(caption_segments))
         
-        for i, segment in enumerate(caption_segments, 1):
-            start_time = self._format_srt_time(segment.get('start_time', 0.0))
-            end_time = self._format_srt_time(segment.get('end_time', 0.0))
-            text = segment.get('text', '').strip()
-            speaker = segment.get('speaker_name', '')
+        if output_path or file is not None:
+            return self._save(_newline_joined(lines), output_path, file, "SRT captions")
+        
+        return "\n".join(lines)
+    
+    def _srt_lines(self, prepared: PreparedCaptions) -> Iterator[str]:
+        """Yield the lines of an SRT file."""
+        for i, (start_time, end_time, text, speaker) in enumerate(
+                zip(prepared.srt_starts, prepared.srt_ends, prepared.texts, prepared.speakers), 1):
             
             # Format with speaker name if available
             if speaker:
@@ -50,40 +118,39 @@ class SimpleCaptionFormatter:
             else:
                 display_text = text
             
-            srt_content.append(f"{i}")
-            srt_content.append(f"{start_time} --> {end_time}")
-            srt_content.append(display_text)
-            srt_content.append("")  # Empty line between segments
-        
-        srt_text = "\n".join(srt_content)
-        
-        if output_path:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(srt_text)
-            logger.info(f"SRT captions saved to: {output_path}")
-            return output_path
-        
-        return srt_text
+            yield f"{i}"
+            yield f"{start_time} --> {end_time}"
+            yield display_text
+            yield ""  # Empty line between segments
     
-    def format_vtt(self, caption_segments: List[Dict[str, Any]], 
-                   output_path: Optional[str] = None) -> str:
+    def format_vtt(self, caption_segments: Union[List[Dict[str, Any]], PreparedCaptions], 
+                   output_path: Optional[str] = None,
+                   file: Optional[TextIO] = None) -> str:
         """
         Format captions as VTT (WebVTT) subtitle file.
         
         Args:
-            caption_segments (List[Dict[str, Any]]): List of caption segments with timing.
+            caption_segments (Union[List[Dict[str, Any]], PreparedCaptions]): Caption segments with timing.
             output_path (str, optional): Path to save VTT file. If None, returns content as string.
+            file (TextIO, optional): Open text file to write to instead of opening output_path.
             
         Returns:
             str: VTT content or path to saved file.
         """
-        vtt_content = ["WEBVTT", ""]  # VTT header
+        lines = self._vtt_lines(self.prepare_segments(caption_segments))
         
-        for segment in caption_segments:
-            start_time = self._format_vtt_time(segment.get('start_time', 0.0))
-            end_time = self._format_vtt_time(segment.get('end_time', 0.0))
-            text = segment.get('text', '').strip()
-            speaker = segment.get('speaker_name', '')
+        if output_path or file is not None:
+            return self._save(_newline_joined(lines), output_path, file, "VTT captions")
+        
+        return "\n".join(lines)
+    
+    def _vtt_lines(self, prepared: PreparedCaptions) -> Iterator[str]:
+        """Yield the lines of a VTT file."""
+        yield "WEBVTT"  # VTT header
+        yield ""
+        
+        for start_time, end_time, text, speaker in zip(
+                prepared.vtt_starts, prepared.vtt_ends, prepared.texts, prepared.speakers):
             
             # Format with speaker name if available
             if speaker:
@@ -91,76 +158,78 @@ class SimpleCaptionFormatter:
             else:
                 display_text = text
             
-            vtt_content.append(f"{start_time} --> {end_time}")
-            vtt_content.append(display_text)
-            vtt_content.append("")  # Empty line between segments
-        
-        vtt_text = "\n".join(vtt_content)
-        
-        if output_path:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(vtt_text)
-            logger.info(f"VTT captions saved to: {output_path}")
-            return output_path
-        
-        return vtt_text
+            yield f"{start_time} --> {end_time}"
+            yield display_text
+            yield ""  # Empty line between segments
     
-    def format_json(self, caption_segments: List[Dict[str, Any]], 
-                    output_path: Optional[str] = None) -> str:
+    def format_json(self, caption_segments: Union[List[Dict[str, Any]], PreparedCaptions], 
+                    output_path: Optional[str] = None,
+                    file: Optional[TextIO] = None) -> str:
         """
         Format captions as JSON for programmatic use.
         
         Args:
-            caption_segments (List[Dict[str, Any]]): List of caption segments with timing.
+            caption_segments (Union[List[Dict[str, Any]], PreparedCaptions]): Caption segments with timing.
             output_path (str, optional): Path to save JSON file. If None, returns content as string.
+            file (TextIO, optional): Open text file to write to instead of opening output_path.
             
         Returns:
             str: JSON content or path to saved file.
         """
         import json
         
+        if isinstance(caption_segments, PreparedCaptions):
+            end_times = caption_segments.end_times
+            caption_segments = caption_segments.segments
+        else:
+            end_times = [seg.get('end_time', 0.0) for seg in caption_segments]
+        
         caption_data = {
             'format': 'vibevoice_script_captions',
             'version': '1.0',
             'generation_method': 'script_based',
             'segments': caption_segments,
             'total_segments': len(caption_segments),
-            'total_duration': max(seg.get('end_time', 0.0) for seg in caption_segments) if caption_segments else 0.0
+            'total_duration': max(end_times) if end_times else 0.0
         }
         
-        json_text = json.dumps(caption_data, indent=2, ensure_ascii=False)
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
         
-        if output_path:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(json_text)
-            logger.info(f"JSON captions saved to: {output_path}")
-            return output_path
+        if output_path or file is not None:
+            return self._save(encoder.iterencode(caption_data), output_path, file, "JSON captions")
         
-        return json_text
+        return encoder.encode(caption_data)
     
-    def format_transcript(self, caption_segments: List[Dict[str, Any]], 
+    def format_transcript(self, caption_segments: Union[List[Dict[str, Any]], PreparedCaptions], 
                           output_path: Optional[str] = None,
                           include_timestamps: bool = True,
-                          include_speakers: bool = True) -> str:
+                          include_speakers: bool = True,
+                          file: Optional[TextIO] = None) -> str:
         """
         Format captions as a readable transcript.
         
         Args:
-            caption_segments (List[Dict[str, Any]]): List of caption segments with timing.
+            caption_segments (Union[List[Dict[str, Any]], PreparedCaptions]): Caption segments with timing.
             output_path (str, optional): Path to save transcript file. If None, returns content as string.
             include_timestamps (bool): Whether to include timestamps in the transcript.
             include_speakers (bool): Whether to include speaker names in the transcript.
+            file (TextIO, optional): Open text file to write to instead of opening output_path.
             
         Returns:
             str: Transcript content or path to saved file.
         """
-        transcript_lines = []
+        lines = self._transcript_lines(self.prepare_segments(caption_segments),
+                                       include_timestamps, include_speakers)
         
-        for segment in caption_segments:
-            text = segment.get('text', '').strip()
-            speaker = segment.get('speaker_name', '')
-            start_time = segment.get('start_time', 0.0)
-            
+        if output_path or file is not None:
+            return self._save(_newline_joined(lines), output_path, file, "Transcript")
+        
+        return "\n".join(lines)
+    
+    def _transcript_lines(self, prepared: PreparedCaptions, include_timestamps: bool,
+                          include_speakers: bool) -> Iterator[str]:
+        """Yield the lines of a transcript."""
+        for text, speaker, timestamp in zip(prepared.texts, prepared.speakers, prepared.readable_starts):
             if not text:
                 continue
             
@@ -168,7 +237,6 @@ class SimpleCaptionFormatter:
             line_parts = []
             
             if include_timestamps:
-                timestamp = self._format_readable_time(start_time)
                 line_parts.append(f"[{timestamp}]")
             
             if include_speakers and speaker:
@@ -176,57 +244,60 @@ class SimpleCaptionFormatter:
             
             line_parts.append(text)
             
-            transcript_lines.append(" ".join(line_parts))
-        
-        transcript_text = "\n".join(transcript_lines)
-        
-        if output_path:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(transcript_text)
-            logger.info(f"Transcript saved to: {output_path}")
-            return output_path
-        
-        return transcript_text
+            yield " ".join(line_parts)
     
-    def format_script_with_timing(self, caption_segments: List[Dict[str, Any]], 
-                                  output_path: Optional[str] = None) -> str:
+    def format_script_with_timing(self, caption_segments: Union[List[Dict[str, Any]], PreparedCaptions], 
+                                  output_path: Optional[str] = None,
+                                  file: Optional[TextIO] = None) -> str:
         """
         Format captions as a script with timing information.
         
         Args:
-            caption_segments (List[Dict[str, Any]]): List of caption segments with timing.
+            caption_segments (Union[List[Dict[str, Any]], PreparedCaptions]): Caption segments with timing.
             output_path (str, optional): Path to save script file. If None, returns content as string.
+            file (TextIO, optional): Open text file to write to instead of opening output_path.
             
         Returns:
             str: Script content or path to saved file.
         """
-        script_lines = []
+        lines = self._script_timing_lines(self.prepare_segments(caption_segments))
         
-        for segment in caption_segments:
-            text = segment.get('text', '').strip()
-            speaker = segment.get('speaker_name', '')
-            start_time = segment.get('start_time', 0.0)
-            end_time = segment.get('end_time', 0.0)
+        if output_path or file is not None:
+            return self._save(_newline_joined(lines), output_path, file, "Script with timing")
+        
+        return "\n".join(lines)
+    
+    def _script_timing_lines(self, prepared: PreparedCaptions) -> Iterator[str]:
+        """Yield the lines of a script with timing."""
+        for text, speaker, start_time, end_time, timestamp in zip(
+                prepared.texts, prepared.speakers, prepared.start_times,
+                prepared.end_times, prepared.readable_starts):
             duration = end_time - start_time
             
             if not text:
                 continue
             
             # Format as script with timing
-            timestamp = self._format_readable_time(start_time)
-            script_lines.append(f"[{timestamp}] {speaker}: {text}")
-            script_lines.append(f"    Duration: {duration:.1f}s")
-            script_lines.append("")  # Empty line between segments
-        
-        script_text = "\n".join(script_lines)
-        
-        if output_path:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(script_text)
-            logger.info(f"Script with timing saved to: {output_path}")
-            return output_path
+            yield f"[{timestamp}] {speaker}: {text}"
+            yield f"    Duration: {duration:.1f}s"
+            yield ""  # Empty line between segments
+    
+    def _save(self, chunks: Iterable[str], output_path: Optional[str],
+              file: Optional[TextIO], description: str) -> str:
+        """
+        Stream formatted chunks to file, or to output_path through a 64 KiB buffer.
         
-        return script_text
+        Returns:
+            str: output_path, or the file's name if only a file was given.
+        """
+        if file is not None:
+            file.writelines(chunks)
+            output_path = output_path or getattr(file, 'name', '')
+        else:
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                f.writelines(chunks)
+        logger.info(f"{description} saved to: {output_path}")
+        return output_path
     
     def create_caption_package(self, 
                               caption_segments: List[Dict[str, Any]],
@@ -246,6 +317,7 @@ class SimpleCaptionFormatter:
         os.makedirs(output_dir, exist_ok=True)
         
         caption_files = {}
+        prepared = self.prepare_segments(caption_segments)
         
         # Generate different formats
         formats = {
@@ -258,12 +330,22 @@ class SimpleCaptionFormatter:
         
         for format_name, formatter_func in formats.items():
             output_path = os.path.join(output_dir, f"{base_filename}.{format_name}")
-            formatter_func(caption_segments, output_path)
+            formatter_func(prepared, output_path)
             caption_files[format_name] = output_path
         
         logger.info(f"Caption package created with {len(caption_files)} formats")
         return caption_files
     
+    def _format_srt_vtt_times(self, seconds: float) -> Tuple[str, str]:
+        """Format a time as both SRT and VTT timestamps, sharing the divmod chain."""
+        td = timedelta(seconds=seconds)
+        hours, remainder = divmod(td.total_seconds(), 3600)
+        minutes, seconds = divmod(remainder, 60)
+        milliseconds = int((seconds % 1) * 1000)
+        
+        hh_mm = f"{int(hours):02d}:{int(minutes):02d}"
+        return f"{hh_mm}:{int(seconds):02d},{milliseconds:03d}", f"{hh_mm}:{seconds:06.3f}"
+    
     def _format_srt_time(self, seconds: float) -> str:
         """Format time in SRT format (HH:MM:SS,mmm)."""
         td = timedelta(seconds=seconds)
@@ -7,22 +7,474 @@ already have the script and just need to add timing information.
 """
 
 import os
+import heapq
 import shutil
 import logging
 import subprocess
-from typing import List, Dict, Any, Optional, Union, Tuple
+import threading
+import importlib.util
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Dict, Any, Optional, Union, Tuple, Iterable
 import re
 from pathlib import Path
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
-# Try to import faster-whisper for word-level alignment
-try:
+# faster-whisper is used for word-level alignment. Only probe for it here; the
+# actual import (ctranslate2, tokenizers, onnxruntime) is deferred to first use.
+FASTER_WHISPER_AVAILABLE = importlib.util.find_spec("faster_whisper") is not None
+if not FASTER_WHISPER_AVAILABLE:
+    logger.warning("faster-whisper not available. Falling back to silence detection.")
+
+
+@lru_cache(maxsize=1)
+def _get_whisper_model_cls():
+    """Import and cache faster-whisper's WhisperModel class on first use."""
     from faster_whisper import WhisperModel
-    FASTER_WHISPER_AVAILABLE = True
+    return WhisperModel
+
+
+# Preferred CTranslate2 compute types per device, fastest first
+_COMPUTE_TYPE_PREFERENCE = {
+    "cpu": ("int8_bfloat16", "int8", "bfloat16", "float32"),
+    "cuda": ("int8_float16", "float16", "float32"),
+}
+
+
+@lru_cache(maxsize=None)
+def _select_compute_type(device: str) -> str:
+    """
+    Pick the fastest compute type the host supports for the given device.
+    
+    int8 is only fast when the CPU has native int8 dot products (e.g. VNNI);
+    CTranslate2's own probe reports what is actually accelerated on this host.
+    """
+    try:
+        import ctranslate2
+        supported = ctranslate2.get_supported_compute_types(device)
+    except Exception as e:
+        logger.debug(f"Could not query CTranslate2 compute types for {device}: {e}")
+        return "int8"
+    
+    for compute_type in _COMPUTE_TYPE_PREFERENCE.get(device, ()):
+        if compute_type in supported:
+            return compute_type
+    return "default"
+
+# numba is optional: without it the jitted kernels below run as plain Python
+try:
+    from numba import njit
 except ImportError:
-    FASTER_WHISPER_AVAILABLE = False
-    logger.warning("faster-whisper not available. Falling back to silence detection.")
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Punctuation stripped from words before matching script text to transcribed words
+_PUNCT_TRANSLATE = str.maketrans("", "", ".,!?;:")
+
+# "Speaker X:" label at the start of a line (spaces/tabs only, never across lines)
+_SPEAKER_LINE = re.compile(r"^[^\S\n]*Speaker[^\S\n]+(\d+)[^\S\n]*:[^\S\n]*", re.IGNORECASE | re.MULTILINE)
+
+# Whitespace following sentence-ending punctuation (., !, ?)
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+# ffmpeg silencedetect output lines ("silence_start: 1.2" / "silence_end: 1.9 | ...")
+_SIL_RE = re.compile(r"silence_(start|end):\s*([0-9.]+)")
+
+# Scripts with at least this many words are aligned with the banded DP kernel
+# instead of the greedy sequential matcher
+_NW_ALIGN_MIN_WORDS = 10000
+_NW_ALIGN_BAND = 64
+# Below this share of exactly matched script words the greedy matcher is used instead
+_NW_ALIGN_MIN_MATCH = 0.5
+
+
+@lru_cache(maxsize=64)
+def _parse_script_rows(script: str, max_words: int) -> Tuple[Tuple[int, str, int, int], ...]:
+    """
+    Split a script into (speaker_id, text, word_count, char_count) chunk rows.
+    
+    Cached per (script, max_words) so repeated passes over the same script skip
+    the parse; rows are immutable and callers build fresh dicts from them.
+    """
+    rows = []
+    
+    # One regex pass over the whole script: [prefix, id1, text1, id2, text2, ...]
+    parts = _SPEAKER_LINE.split(script.strip())
+    blocks = [(None, parts[0])]
+    blocks.extend((int(parts[i]), parts[i + 1]) for i in range(1, len(parts), 2))
+    
+    for speaker_id, block in blocks:
+        for line in block.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+    
+            if speaker_id is None:
+                # No previous speaker found, default to Speaker 1
+                logger.warning(f"No speaker label found for line, defaulting to Speaker 1: {line[:50]}...")
+                speaker_id = 1
+    
+            # Group the line's sentences into chunks; chunks never span lines
+            current_chunk = []
+            current_word_count = 0
+    
+            for sentence in _SENTENCE_BOUNDARY.split(line):
+                if not sentence:
+                    continue
+                sentence_word_count = len(sentence.split())
+    
+                # If adding this sentence would exceed max_words, save current chunk and start a new one
+                if current_word_count + sentence_word_count > max_words and current_chunk:
+                    chunk_text = ' '.join(current_chunk)
+                    rows.append((speaker_id, chunk_text, current_word_count, len(chunk_text)))
+                    current_chunk = [sentence]
+                    current_word_count = sentence_word_count
+                else:
+                    # Add sentence to current chunk (even if it exceeds max_words)
+                    current_chunk.append(sentence)
+                    current_word_count += sentence_word_count
+    
+            # Add any remaining chunk
+            if current_chunk:
+                chunk_text = ' '.join(current_chunk)
+                rows.append((speaker_id, chunk_text, current_word_count, len(chunk_text)))
+    
+    return tuple(rows)
+
+
+@njit(cache=True)
+def _nw_align(script_ids, tx_ids, lo, hi):
+    """
+    Banded Needleman-Wunsch alignment of script word ids to transcribed word ids.
+
+    Row i of the DP (i script words consumed) only covers transcript columns
+    lo[i]..hi[i] (see _nw_band_limits), so memory is O(N * band + M) rather
+    than O(N * M). Rows must overlap their neighbours, with lo[0] == 0 and
+    hi[N] == M.
+
+    Returns:
+        int32 array with, for each script token, the index of the transcribed
+        token it was aligned to (match or substitution), or -1 if it was skipped.
+    """
+    n = script_ids.shape[0]
+    m = tx_ids.shape[0]
+    out = np.full(n, -1, dtype=np.int32)
+    if n == 0 or m == 0:
+        return out
+
+    neg = np.int32(-(1 << 29))
+    match_score = np.int32(2)
+    mismatch_score = np.int32(-1)
+    gap_score = np.int32(-1)
+
+    # Row i's trace cells start at offsets[i]
+    offsets = np.empty(n + 2, dtype=np.int64)
+    offsets[0] = 0
+    for i in range(n + 1):
+        offsets[i + 1] = offsets[i] + hi[i] - lo[i] + 1
+
+    # trace: 0 = unreachable, 1 = diagonal, 2 = up (script gap), 3 = left (transcript gap)
+    trace = np.zeros(offsets[n + 1], dtype=np.int8)
+    # Scores indexed by column; only each row's lo..hi range is meaningful
+    prev = np.full(m + 1, neg, dtype=np.int32)
+    cur = np.full(m + 1, neg, dtype=np.int32)
+
+    for j in range(lo[0], hi[0] + 1):
+        prev[j] = gap_score * j
+        if j > 0:
+            trace[offsets[0] + j - lo[0]] = 3
+
+    for i in range(1, n + 1):
+        sid = script_ids[i - 1]
+        prev_lo = lo[i - 1]
+        prev_hi = hi[i - 1]
+        for j in range(lo[i], hi[i] + 1):
+            cell = offsets[i] + j - lo[i]
+            if j == 0:
+                cur[j] = gap_score * i
+                trace[cell] = 2
+                continue
+            best = neg
+            direction = 0
+            # Diagonal: D[i-1][j-1]
+            if prev_lo <= j - 1 <= prev_hi and prev[j - 1] > neg:
+                best = prev[j - 1] + (match_score if tx_ids[j - 1] == sid else mismatch_score)
+                direction = 1
+            # Up: D[i-1][j]
+            if prev_lo <= j <= prev_hi and prev[j] > neg and prev[j] + gap_score > best:
+                best = prev[j] + gap_score
+                direction = 2
+            # Left: D[i][j-1]
+            if j > lo[i] and cur[j - 1] > neg and cur[j - 1] + gap_score > best:
+                best = cur[j - 1] + gap_score
+                direction = 3
+            cur[j] = best
+            trace[cell] = direction
+        prev, cur = cur, prev
+
+    # Trace back from (n, m), which the last row always covers
+    i = n
+    j = m
+    while i > 0 and j > 0:
+        direction = trace[offsets[i] + j - lo[i]]
+        if direction == 1:
+            out[i - 1] = j - 1
+            i -= 1
+            j -= 1
+        elif direction == 2:
+            i -= 1
+        elif direction == 3:
+            j -= 1
+        else:
+            break
+    return out
+
+
+def _nw_band_limits(script_ids: np.ndarray, tx_ids: np.ndarray, band: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Column range lo[i]..hi[i] of each _nw_align row.
+    
+    The band follows a path through anchor pairs: words that occur exactly once
+    in both the script and the transcript, reduced to their longest chain that
+    is increasing on both sides. Between anchors (and without any) the path is
+    interpolated, so an untranscribed intro or a skipped passage moves the band
+    with the alignment instead of leaving the true path outside it. Row i spans
+    from its own path column to the next row's, so jumps of any length fit.
+    """
+    n = script_ids.shape[0]
+    m = tx_ids.shape[0]
+    
+    script_unique, script_pos, script_counts = np.unique(script_ids, return_index=True, return_counts=True)
+    tx_unique, tx_pos, tx_counts = np.unique(tx_ids, return_index=True, return_counts=True)
+    _, script_sel, tx_sel = np.intersect1d(script_unique[script_counts == 1], tx_unique[tx_counts == 1],
+                                           assume_unique=True, return_indices=True)
+    anchor_rows = script_pos[script_counts == 1][script_sel]
+    anchor_cols = tx_pos[tx_counts == 1][tx_sel]
+    order = np.argsort(anchor_rows)
+    anchor_rows = anchor_rows[order].tolist()
+    anchor_cols = anchor_cols[order].tolist()
+    
+    # Longest chain of anchors with increasing transcript positions
+    tails: List[int] = []  # anchor index ending the best chain of each length
+    tail_cols: List[int] = []
+    parents = [-1] * len(anchor_cols)
+    for k, col in enumerate(anchor_cols):
+        length = bisect_left(tail_cols, col)
+        if length > 0:
+            parents[k] = tails[length - 1]
+        if length == len(tails):
+            tails.append(k)
+            tail_cols.append(col)
+        else:
+            tails[length] = k
+            tail_cols[length] = col
+    chain = []
+    k = tails[-1] if tails else -1
+    while k >= 0:
+        chain.append(k)
+        k = parents[k]
+    chain.reverse()
+    
+    # Anchor (row, col) aligns script word row with transcript word col: DP cell (row + 1, col + 1)
+    path_rows = np.array([0] + [anchor_rows[k] + 1 for k in chain] + [n], dtype=np.float64)
+    path_cols = np.array([0] + [anchor_cols[k] + 1 for k in chain] + [m], dtype=np.float64)
+    centre = np.rint(np.interp(np.arange(n + 2), path_rows, path_cols)).astype(np.int64)
+    lo = np.clip(centre[:-1] - band, 0, m)
+    hi = np.clip(centre[1:] + band, 0, m)
+    hi[-1] = m
+    return lo, hi
+
+
+@njit(cache=True)
+def _compute_split_indices(word_counts, start_times, end_times, max_duration):
+    """
+    Index and timing plan for SimpleCaptionGenerator.split_long_segments.
+    
+    Returns:
+        (segment_idx, start_word, end_word, segment_start, segment_end) arrays with
+        one row per output segment; start_word is -1 for segments kept unsplit.
+    """
+    n = word_counts.shape[0]
+    durations = end_times - start_times
+    
+    # Sub-segment count per input segment (0 means keep as-is)
+    num_splits = np.zeros(n, dtype=np.int32)
+    total = 0
+    for i in range(n):
+        if durations[i] <= max_duration:
+            total += 1
+        else:
+            num_splits[i] = max(1, int(durations[i] / max_duration))
+            total += num_splits[i]
+    
+    segment_idx = np.empty(total, dtype=np.int32)
+    start_word = np.empty(total, dtype=np.int32)
+    end_word = np.empty(total, dtype=np.int32)
+    segment_start = np.empty(total, dtype=np.float64)
+    segment_end = np.empty(total, dtype=np.float64)
+    
+    row = 0
+    for i in range(n):
+        num_segments = num_splits[i]
+        if num_segments == 0:
+            segment_idx[row] = i
+            start_word[row] = -1
+            end_word[row] = -1
+            segment_start[row] = start_times[i]
+            segment_end[row] = end_times[i]
+            row += 1
+            continue
+        
+        num_words = word_counts[i]
+        words_per_segment = num_words // num_segments
+        segment_duration = durations[i] / num_segments
+        for k in range(num_segments):
+            segment_idx[row] = i
+            start_word[row] = k * words_per_segment
+            end_word[row] = start_word[row] + words_per_segment if k < num_segments - 1 else num_words
+            segment_start[row] = start_times[i] + k * segment_duration
+            segment_end[row] = segment_start[row] + segment_duration
+            row += 1
+    
+    return segment_idx, start_word, end_word, segment_start, segment_end
+
+
+def _speaker_name_table(speaker_ids: Iterable[int],
+                        speaker_mapping: Optional[Dict[int, str]] = None) -> Dict[int, str]:
+    """Display name for each distinct speaker id, resolved once per speaker rather than per segment."""
+    if speaker_mapping:
+        return {sid: speaker_mapping.get(sid, f"Speaker {sid}") for sid in set(speaker_ids)}
+    return {sid: f"Speaker {sid}" for sid in set(speaker_ids)}
+
+
+def _merge_smallest_adjacent(segments: List[Tuple[float, float]],
+                             target_count: int) -> List[Tuple[float, float]]:
+    """
+    Repeatedly merge the adjacent pair with the smallest combined duration
+    until only target_count segments remain.
+    
+    Uses a lazy-deletion heap of pair scores over a linked list of segments, so
+    each merge costs O(log N) instead of a full rescan plus a list shift. Ties
+    go to the leftmost pair, matching a left-to-right linear scan.
+    """
+    n = len(segments)
+    target_count = max(target_count, 1)
+    if n <= target_count:
+        return list(segments)
+    
+    starts = [start for start, _ in segments]
+    ends = [end for _, end in segments]
+    next_idx = list(range(1, n + 1))
+    next_idx[-1] = -1
+    prev_idx = list(range(-1, n - 1))
+    # Bumped whenever a segment changes; -1 marks a segment merged away
+    version = [0] * n
+    
+    heap = [((ends[i] - starts[i]) + (ends[i + 1] - starts[i + 1]), i, i + 1, 0, 0)
+            for i in range(n - 1)]
+    heapq.heapify(heap)
+    
+    remaining = n
+    while remaining > target_count:
+        _, i, j, version_i, version_j = heapq.heappop(heap)
+        if next_idx[i] != j or version[i] != version_i or version[j] != version_j:
+            continue  # Stale entry: one side was merged since it was pushed
+        
+        ends[i] = ends[j]
+        version[i] += 1
+        version[j] = -1
+        next_idx[i] = next_idx[j]
+        if next_idx[i] >= 0:
+            prev_idx[next_idx[i]] = i
+        remaining -= 1
+        
+        k = next_idx[i]
+        if k >= 0:
+            heapq.heappush(heap, ((ends[i] - starts[i]) + (ends[k] - starts[k]), i, k, version[i], version[k]))
+        h = prev_idx[i]
+        if h >= 0:
+            heapq.heappush(heap, ((ends[h] - starts[h]) + (ends[i] - starts[i]), h, i, version[h], version[i]))
+    
+    merged: List[Tuple[float, float]] = []
+    i = 0
+    while i >= 0:
+        merged.append((starts[i], ends[i]))
+        i = next_idx[i]
+    return merged
+
+
+def _split_longest(segments: List[Tuple[float, float]],
+                   target_count: int) -> List[Tuple[float, float]]:
+    """
+    Repeatedly split the longest segment at its midpoint until there are
+    target_count segments.
+    
+    Segments live in a max-heap keyed on duration; each carries a tuple sort
+    key (the halves of key k get k + (0,) and k + (1,)) that preserves timeline
+    order, so ties go to the earliest segment and the result needs only one sort.
+    """
+    if not segments or len(segments) >= target_count:
+        return list(segments)
+    
+    heap = [(-(end - start), (i,), start, end) for i, (start, end) in enumerate(segments)]
+    heapq.heapify(heap)
+    for _ in range(target_count - len(segments)):
+        _, key, start, end = heapq.heappop(heap)
+        mid = (start + end) / 2.0
+        heapq.heappush(heap, (-(mid - start), key + (0,), start, mid))
+        heapq.heappush(heap, (-(end - mid), key + (1,), mid, end))
+    
+    heap.sort(key=lambda entry: entry[1])
+    return [(start, end) for _, _, start, end in heap]
+
+
+def _snap_to_hints(segments: List[Tuple[float, float]],
+                   hints: List[float],
+                   tol: float = 0.5) -> List[Tuple[float, float]]:
+    """
+    Move segment boundaries onto known sentence start times.
+    
+    For each hint, the boundary between two adjacent segments that lies closest
+    to it (and within tol seconds) is moved onto the hint: the earlier segment
+    ends there and the later one starts there. The segment count never changes.
+    
+    Args:
+        segments (List[Tuple[float, float]]): Time-ordered (start, end) segments.
+        hints (List[float]): Sentence start times in seconds.
+        tol (float): Maximum distance between a boundary and a hint.
+        
+    Returns:
+        List[Tuple[float, float]]: Segments with snapped boundaries.
+    """
+    if not hints or len(segments) < 2:
+        return segments
+    
+    # Boundary k (1 <= k < n) is where segment k starts
+    boundaries = np.fromiter((start for start, _ in segments), dtype=np.float64, count=len(segments))
+    snapped = list(segments)
+    for hint in hints:
+        k = int(np.searchsorted(boundaries, hint))
+        candidates = [c for c in (k - 1, k) if 1 <= c < len(snapped)]
+        if not candidates:
+            continue
+        k = min(candidates, key=lambda c: abs(boundaries[c] - hint))
+        if abs(boundaries[k] - hint) > tol:
+            continue
+        prev_start, _ = snapped[k - 1]
+        _, next_end = snapped[k]
+        if prev_start < hint < next_end:
+            snapped[k - 1] = (prev_start, hint)
+            snapped[k] = (hint, next_end)
+            logger.debug(f"Snapped segment boundary {boundaries[k]:.2f}s to hint {hint:.2f}s")
+    return snapped
 
 
 class SimpleCaptionGenerator:
@@ -39,7 +491,8 @@ class SimpleCaptionGenerator:
                  min_segment_duration: float = 1.0,
                  max_segment_duration: float = 60.0,
                  pause_between_speakers: float = 1.0,  # Significantly increased
-                 pause_between_segments: float = 0.8):  # Significantly increased
+                 pause_between_segments: float = 0.8,  # Significantly increased
+                 boundary_hints: Optional[List[float]] = None):
         """
         Initialize the simple caption generator.
         
@@ -49,6 +502,8 @@ class SimpleCaptionGenerator:
             max_segment_duration (float): Maximum duration for a caption segment.
             pause_between_speakers (float): Pause duration when speaker changes.
             pause_between_segments (float): Pause duration between segments from same speaker.
+            boundary_hints (List[float], optional): Known sentence start times (seconds);
+                silence-aligned segment boundaries within 0.5s of a hint are moved onto it.
         """
         self.words_per_minute = words_per_minute
         self.min_segment_duration = min_segment_duration
@@ -58,6 +513,13 @@ class SimpleCaptionGenerator:
         self.audio_silence_threshold_db = -30.0
         self.audio_silence_min_duration = 0.25
         self.min_detected_segment_duration = 0.6
+        self.boundary_hints = sorted(boundary_hints) if boundary_hints else []
+        # faster-whisper model, built once and shared by all alignment calls
+        # (0 lets CTranslate2 pick; lower it when aligning several files in parallel)
+        self.whisper_cpu_threads = 0
+        self._whisper_model = None
+        self._whisper_model_workers = 0
+        self._whisper_model_lock = threading.Lock()
     
     def _split_into_sentences(self, text: str) -> List[str]:
         """
@@ -77,8 +539,7 @@ class SimpleCaptionGenerator:
         
         # Split on sentence-ending punctuation followed by whitespace
         # Uses positive lookbehind to keep punctuation with the sentence
-        # Pattern: (?<=[.!?])\s+ means: split on whitespace that follows ., !, or ?
-        parts = re.split(r"(?<=[.!?])\s+", text.strip())
+        parts = _SENTENCE_BOUNDARY.split(text.strip())
         
         # Filter out empty strings and strip whitespace
         sentences = [p.strip() for p in parts if p and p.strip()]
@@ -93,7 +554,8 @@ class SimpleCaptionGenerator:
                                     script: str,
                                     audio_duration: float,
                                     speaker_mapping: Optional[Dict[int, str]] = None,
-                                    audio_path: Optional[str] = None) -> List[Dict[str, Any]]:
+                                    audio_path: Optional[str] = None,
+                                    split_long: bool = False) -> List[Dict[str, Any]]:
         """
         Generate captions from script text and audio duration.
         
@@ -102,6 +564,8 @@ class SimpleCaptionGenerator:
             audio_duration (float): Total duration of the audio in seconds.
             speaker_mapping (Dict[int, str], optional): Mapping of speaker IDs to names.
             audio_path (str, optional): Path to the audio file for precise alignment.
+            split_long (bool): Split segments longer than max_segment_duration before
+                returning (see split_long_segments).
             
         Returns:
             List[Dict[str, Any]]: List of caption segments with timing.
@@ -123,102 +587,133 @@ class SimpleCaptionGenerator:
             audio_path
         )
         
+        if split_long:
+            caption_segments = self.split_long_segments(caption_segments, max_duration=self.max_segment_duration)
+        
         logger.info(f"Generated {len(caption_segments)} caption segments")
         return caption_segments
     
-    def _parse_script_segments(self, script: str) -> List[Dict[str, Any]]:
+    def generate_captions_parallel(self,
+                                   jobs: List[Dict[str, Any]],
+                                   max_workers: Optional[int] = None) -> List[List[Dict[str, Any]]]:
         """
-        Parse script into segments with speaker information.
+        Generate captions for many audio files concurrently.
         
-        Handles both "Speaker X: text" format and plain text lines.
-        Plain text lines are treated as continuation of the previous speaker.
+        Jobs run on a thread pool that shares a single faster-whisper model.
+        CTranslate2 releases the GIL during encoding/decoding, so this scales with
+        CPU cores. When max_workers > 1, consider lowering ``whisper_cpu_threads``
+        (e.g. to 2) before calling this to avoid oversubscribing the CPU.
+        
+        Args:
+            jobs (List[Dict[str, Any]]): Keyword arguments for generate_captions_from_script,
+                one dict per file ('script', 'audio_duration', and optionally
+                'speaker_mapping' and 'audio_path').
+            max_workers (int, optional): Number of worker threads. Defaults to half the CPU count.
+            
+        Returns:
+            List[List[Dict[str, Any]]]: Caption segments for each job, in input order.
         """
-        segments = []
-        lines = script.strip().split('\n')
-        current_speaker_id = None  # Track current speaker for continuation lines
+        if not jobs:
+            return []
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Match "Speaker X: text" format
-            match = re.match(r'^Speaker\s+(\d+)\s*:\s*(.*)$', line, re.IGNORECASE)
-            if match:
-                current_speaker_id = int(match.group(1))
-                text = match.group(2).strip()
-                if text:
-                    # Split long segments into smaller chunks (max 15 words)
-                    segments.extend(self._split_long_segment(current_speaker_id, text))
-            else:
-                # Line without speaker label - treat as continuation of previous speaker
-                if current_speaker_id is not None:
-                    # Continue with the last speaker
-                    segments.extend(self._split_long_segment(current_speaker_id, line))
-                else:
-                    # No previous speaker found, default to Speaker 1
-                    logger.warning(f"No speaker label found for line, defaulting to Speaker 1: {line[:50]}...")
-                    current_speaker_id = 1
-                    segments.extend(self._split_long_segment(current_speaker_id, line))
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) // 2)
+        max_workers = min(max_workers, len(jobs))
         
-        return segments
+        # Build the shared model up front so workers never construct their own
+        if FASTER_WHISPER_AVAILABLE and any(job.get('audio_path') for job in jobs):
+            try:
+                self._get_whisper_model(num_workers=max_workers)
+            except Exception as e:
+                logger.warning(f"Failed to load faster-whisper model: {e}")
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._generate_captions_job, jobs))
+    
+    def _generate_captions_job(self, job: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run generate_captions_from_script for a single generate_captions_parallel job."""
+        return self.generate_captions_from_script(**job)
     
-    def _split_long_segment(self, speaker_id: int, text: str, max_words: int = 15) -> List[Dict[str, Any]]:
+    def detect_segments_batch(self,
+                              audio_paths: List[str],
+                              audio_durations: List[float],
+                              target_segments: List[int],
+                              max_workers: Optional[int] = None) -> List[Optional[List[Tuple[float, float]]]]:
         """
-        Split text segments by sentences only, keeping sentences intact.
+        Run silence-based segment detection for many audio files in parallel.
         
-        This method splits text into sentences and groups them into chunks.
-        Each sentence is kept intact - if a sentence is longer than max_words,
-        it will still be kept as a single segment.
+        Each file is decoded by its own ffmpeg process, fanned out over a process
+        pool. Every ffmpeg run is limited to one thread so the pool, not ffmpeg,
+        owns the parallelism; a single file keeps ffmpeg's own threading.
         
         Args:
-            speaker_id (int): Speaker ID for the segment.
-            text (str): Text to split into chunks.
-            max_words (int): Maximum words per chunk (used as a guideline, but sentences are never split).
+            audio_paths (List[str]): Audio files to analyze.
+            audio_durations (List[float]): Duration of each file in seconds.
+            target_segments (List[int]): Number of text segments for each file.
+            max_workers (int, optional): Number of worker processes. Defaults to half the CPU count.
             
         Returns:
-            List[Dict[str, Any]]: List of text segments with metadata.
+            List[Optional[List[Tuple[float, float]]]]: Speech segments for each file
+                (None where detection failed), in input order.
         """
-        segments = []
+        if not audio_paths:
+            return []
         
-        # Split into sentences - each sentence is kept intact
-        sentences = self._split_into_sentences(text)
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) // 2)
+        max_workers = min(max_workers, len(audio_paths))
+        
+        if max_workers == 1:
+            return [
+                self._detect_audio_aligned_segments(path, duration, target)
+                for path, duration, target in zip(audio_paths, audio_durations, target_segments)
+            ]
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                self._detect_audio_aligned_segments,
+                audio_paths,
+                audio_durations,
+                target_segments,
+                repeat(1),
+                chunksize=1
+            ))
+    
+    def __getstate__(self):
+        # The faster-whisper model and its lock can't be pickled (e.g. for
+        # detect_segments_batch workers); each process rebuilds them lazily
+        state = self.__dict__.copy()
+        state['_whisper_model'] = None
+        state['_whisper_model_workers'] = 0
+        del state['_whisper_model_lock']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._whisper_model_lock = threading.Lock()
+    
+    def _parse_script_segments(self, script: str, max_words: int = 15) -> List[Dict[str, Any]]:
+        """
+        Parse script into sentence-aligned segments with speaker information.
         
-        current_chunk = []
-        current_word_count = 0
+        Handles both "Speaker X: text" format and plain text lines.
+        Plain text lines are treated as continuation of the previous speaker.
         
-        for sentence in sentences:
-            sentence_words = sentence.split()
-            sentence_word_count = len(sentence_words)
-            
-            # Check if adding this sentence would exceed max_words
-            # If so, save current chunk and start a new one
-            if current_word_count + sentence_word_count > max_words and current_chunk:
-                chunk_text = ' '.join(current_chunk)
-                segments.append({
-                    'speaker_id': speaker_id,
-                    'text': chunk_text,
-                    'word_count': current_word_count,
-                    'char_count': len(chunk_text)
-                })
-                current_chunk = [sentence]
-                current_word_count = sentence_word_count
-            else:
-                # Add sentence to current chunk (even if it exceeds max_words)
-                current_chunk.append(sentence)
-                current_word_count += sentence_word_count
-        
-        # Add any remaining chunk
-        if current_chunk:
-            chunk_text = ' '.join(current_chunk)
-            segments.append({
-                'speaker_id': speaker_id,
-                'text': chunk_text,
-                'word_count': current_word_count,
-                'char_count': len(chunk_text)
-            })
+        Each line is split into sentences and consecutive sentences are grouped
+        into chunks. Sentences are kept intact - if a sentence is longer than
+        max_words, it will still be kept as a single segment.
         
-        return segments
+        Args:
+            script (str): Script text with speaker labels.
+            max_words (int): Maximum words per chunk (used as a guideline, but sentences are never split).
+            
+        Returns:
+            List[Dict[str, Any]]: List of text segments with metadata.
+        """
+        return [
+            {'speaker_id': speaker_id, 'text': text, 'word_count': word_count, 'char_count': char_count}
+            for speaker_id, text, word_count, char_count in _parse_script_rows(script, max_words)
+        ]
     
     def _calculate_timing(self, 
                          script_segments: List[Dict[str, Any]], 
@@ -229,8 +724,11 @@ class SimpleCaptionGenerator:
         if not script_segments:
             return []
         
+        # Stat the audio file once; both alignment strategies below need it
+        audio_exists = bool(audio_path) and os.path.exists(audio_path)
+        
         # Try to use faster-whisper for word-level alignment first (most accurate)
-        if audio_path and os.path.exists(audio_path) and FASTER_WHISPER_AVAILABLE:
+        if audio_exists and FASTER_WHISPER_AVAILABLE:
             faster_whisper_alignment = self._align_with_faster_whisper(audio_path, script_segments)
             if faster_whisper_alignment:
                 logger.info("Using faster-whisper word-level alignment for accurate timing.")
@@ -243,7 +741,7 @@ class SimpleCaptionGenerator:
         
         # Fallback to silence detection if faster-whisper is not available or fails
         audio_aligned_segments = None
-        if audio_path and os.path.exists(audio_path):
+        if audio_exists:
             audio_aligned_segments = self._detect_audio_aligned_segments(
                 audio_path,
                 audio_duration,
@@ -293,9 +791,6 @@ class SimpleCaptionGenerator:
         else:
             time_scale = 1.0
         
-        # Debug: print timing info
-        print(f"Timing: estimated={estimated_duration:.1f}s, audio={audio_duration:.1f}s, scale={time_scale:.2f}")
-        
         # Generate caption segments with timing
         caption_segments = []
         current_time = 0.0
@@ -355,14 +850,12 @@ class SimpleCaptionGenerator:
             scaled_pause_durations = pause_durations
         
         
+        name_table = _speaker_name_table((seg['speaker_id'] for seg in script_segments), speaker_mapping)
+        
         # Generate caption segments with adjusted timings
         for i, segment in enumerate(script_segments):
             segment_duration = adjusted_segment_durations[i]
             
-            # Debug: print timing for first few segments
-            if i < 3:
-                print(f"Segment {i+1}: duration={segment_duration:.2f}s")
-            
             # Calculate end time
             end_time = current_time + segment_duration
             
@@ -383,7 +876,7 @@ class SimpleCaptionGenerator:
             
             # Get speaker name
             speaker_id = segment['speaker_id']
-            speaker_name = speaker_mapping.get(speaker_id, f"Speaker {speaker_id}") if speaker_mapping else f"Speaker {speaker_id}"
+            speaker_name = name_table[speaker_id]
             
             caption_segments.append({
                 'start_time': current_time,
@@ -407,17 +900,49 @@ class SimpleCaptionGenerator:
                     pause_duration = max(0.0, remaining_time)
                 
                 current_time += pause_duration
-            
-            # Debug: print timing for last few segments
-            if i >= len(script_segments) - 3:
-                print(f"Final Segment {i+1}: start={caption_segments[-1]['start_time']:.2f}s, end={caption_segments[-1]['end_time']:.2f}s, duration={caption_segments[-1]['end_time'] - caption_segments[-1]['start_time']:.2f}s")
         
         # Final check: ensure last segment ends exactly at audio_duration
         if caption_segments:
             caption_segments[-1]['end_time'] = audio_duration
         
+        # Single debug summary instead of per-segment output in the loop above
+        if logger.isEnabledFor(logging.DEBUG) and caption_segments:
+            logger.debug(
+                "Timing: estimated=%.1fs, audio=%.1fs, scale=%.2f, segments=%d, first=[%.2fs-%.2fs], last=[%.2fs-%.2fs]",
+                estimated_duration, audio_duration, time_scale, len(caption_segments),
+                caption_segments[0]['start_time'], caption_segments[0]['end_time'],
+                caption_segments[-1]['start_time'], caption_segments[-1]['end_time']
+            )
+        
         return caption_segments
     
+    def _get_whisper_model(self, num_workers: int = 1):
+        """
+        Return the shared faster-whisper model, building it on first use.
+        
+        Args:
+            num_workers: Number of threads that may call transcribe() concurrently.
+                The model is rebuilt if the cached one was created with fewer workers.
+        """
+        with self._whisper_model_lock:
+            if self._whisper_model is None or self._whisper_model_workers < num_workers:
+                # Use CPU by default to avoid CUDA compatibility issues
+                # Can be changed to "cuda" if CUDA is properly configured
+                device = "cpu"
+                compute_type = _select_compute_type(device)
+                
+                logger.info(f"Loading faster-whisper model on {device} ({compute_type}, {num_workers} worker(s))")
+                WhisperModel = _get_whisper_model_cls()
+                self._whisper_model = WhisperModel(
+                    "base",
+                    device=device,
+                    compute_type=compute_type,
+                    cpu_threads=self.whisper_cpu_threads,
+                    num_workers=num_workers
+                )
+                self._whisper_model_workers = num_workers
+            return self._whisper_model
+    
     def _align_with_faster_whisper(self,
                                    audio_path: str,
                                    script_segments: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
@@ -435,15 +960,10 @@ class SimpleCaptionGenerator:
             return None
         
         try:
-            # Use CPU by default to avoid CUDA compatibility issues
-            # Can be changed to "cuda" if CUDA is properly configured
-            device = "cpu"
-            compute_type = "int8"
-            
-            logger.info(f"Transcribing audio with faster-whisper on {device}...")
+            logger.info("Transcribing audio with faster-whisper...")
             
-            # Load model
-            model = WhisperModel("base", device=device, compute_type=compute_type)
+            # Load model (cached across calls)
+            model = self._get_whisper_model()
             
             # Transcribe with word timestamps
             segments, info = model.transcribe(
@@ -454,17 +974,10 @@ class SimpleCaptionGenerator:
             )
             
             # Extract word segments from transcription
+            # `segments` is a lazy generator; only the word timings are kept
             word_segments = []
-            transcription_segments = []
-            
+
             for segment in segments:
-                segment_dict = {
-                    'start': segment.start,
-                    'end': segment.end,
-                    'text': segment.text
-                }
-                transcription_segments.append(segment_dict)
-                
                 # Extract word-level timings
                 if hasattr(segment, 'words') and segment.words:
                     for word_info in segment.words:
@@ -478,11 +991,10 @@ class SimpleCaptionGenerator:
                 logger.warning("faster-whisper transcription returned no word segments")
                 return None
             
-            logger.info(f"Successfully transcribed {len(word_segments)} words with timings from {len(transcription_segments)} segments")
-            
+            logger.info(f"Successfully transcribed {len(word_segments)} words with timings")
+
             return {
                 'word_segments': word_segments,
-                'transcription_segments': transcription_segments,
                 'script_segments': script_segments
             }
                 
@@ -510,29 +1022,45 @@ class SimpleCaptionGenerator:
             logger.warning("No word segments in faster-whisper alignment")
             return []
 
-        # Create a list of transcribed words in order
-        transcribed_words = [ws['word'] for ws in word_segments]
+        # Create a list of transcribed words in order, normalized once for matching
+        transcribed_words = [ws['word'].strip().translate(_PUNCT_TRANSLATE).casefold() for ws in word_segments]
         word_timings = word_segments  # Keep full timing info
 
-        import re
+        all_segment_words = [self._normalize_match_words(s.get('text', '')) for s in script_segments_original]
+
+        # Long scripts are aligned globally with the banded DP kernel; the greedy
+        # matcher below handles the usual short podcast scripts, and long ones the
+        # kernel could not align
+        nw_spans = None
+        if sum(len(words) for words in all_segment_words) >= _NW_ALIGN_MIN_WORDS:
+            nw_spans = self._nw_segment_spans(all_segment_words, transcribed_words)
+
+        # Positions of each transcribed word, so the greedy matcher only visits
+        # candidate starts instead of scanning its whole search window
+        anchor_positions: Dict[str, List[int]] = defaultdict(list)
+        if nw_spans is None:
+            for i, word in enumerate(transcribed_words):
+                anchor_positions[word].append(i)
+
+        # Prefix sums of script word counts for the proportional-timing fallback
+        word_counts = np.fromiter((s.get('word_count', len(s.get('text', '').split()))
+                                   for s in script_segments_original),
+                                  dtype=np.int64, count=len(script_segments_original))
+        cum_word_counts = np.cumsum(word_counts)
+        total_words = int(cum_word_counts[-1]) if len(cum_word_counts) else 0
 
         caption_segments = []
         word_idx = 0
 
+        name_table = _speaker_name_table(
+            (s.get('speaker_id', 1) for s in script_segments_original), speaker_mapping
+        )
         for seg_idx, text_segment in enumerate(script_segments_original):
             segment_text = text_segment.get('text', '')
             if not segment_text:
                 continue
 
-            # Clean the script text for matching (remove speaker labels, normalize)
-            clean_text = re.sub(r'Speaker\s+\d+:\s*', '', segment_text)
-            # Normalize quotes and punctuation for better matching
-            clean_text = clean_text.replace("'", "'").replace("'", "'")
-            clean_text = clean_text.replace(""", '"').replace(""", '"')
-            clean_text = clean_text.replace("—", "-").replace("–", "-")
-            clean_text = clean_text.replace("…", "...")
-
-            segment_words = [w.strip('.,!?;:').lower() for w in clean_text.split() if w.strip()]
+            segment_words = all_segment_words[seg_idx]
 
             if not segment_words:
                 continue
@@ -544,17 +1072,26 @@ class SimpleCaptionGenerator:
             matched_count = 0
             start_word_idx = None
 
-            # Limit search window to prevent jumping too far ahead
-            # Only search within next 200 words to prevent false matches later in audio
-            search_limit = min(word_idx + 200, len(transcribed_words))
+            if nw_spans is not None:
+                # Use the global alignment instead of the greedy search
+                if nw_spans[seg_idx] is not None:
+                    first_tx, last_tx = nw_spans[seg_idx]
+                    segment_start = word_timings[first_tx]['start']
+                    segment_end = word_timings[last_tx]['end']
+            else:
+                # Limit search window to prevent jumping too far ahead
+                # Only search within next 200 words to prevent false matches later in audio
+                search_limit = min(word_idx + 200, len(transcribed_words))
 
-            # Look for the first word of this segment in the transcribed words
-            # Start from current position and search forward only
-            for i in range(word_idx, search_limit):
-                transcribed_word = transcribed_words[i].strip().lower()
+                # Look for the first word of this segment in the transcribed words
+                # Start from current position and search forward only, visiting
+                # just the positions where the first word occurs
+                candidates = anchor_positions.get(segment_words[0], [])
+                for candidate_idx in range(bisect_left(candidates, word_idx), len(candidates)):
+                    i = candidates[candidate_idx]
+                    if i >= search_limit:
+                        break
 
-                # Check for exact match first
-                if transcribed_word == segment_words[0]:
                     segment_start = word_timings[i]['start']
                     start_word_idx = i
                     matched_count = 1
@@ -562,7 +1099,7 @@ class SimpleCaptionGenerator:
                     # Continue matching subsequent words sequentially
                     max_lookahead = min(i + len(segment_words) + 5, len(transcribed_words))
                     for j in range(i + 1, max_lookahead):
-                        next_transcribed = transcribed_words[j].strip().lower()
+                        next_transcribed = transcribed_words[j]
 
                         if matched_count < len(segment_words):
                             expected_word = segment_words[matched_count]
@@ -594,11 +1131,8 @@ class SimpleCaptionGenerator:
             # This prevents jumping to wrong parts of audio
             if segment_start is None:
                 # Final fallback: proportional timing
-                total_words_before = sum(s.get('word_count', len(s.get('text', '').split()))
-                                        for s in script_segments_original[:seg_idx])
-                total_words = sum(s.get('word_count', len(s.get('text', '').split()))
-                                 for s in script_segments_original)
                 if total_words > 0:
+                    total_words_before = int(cum_word_counts[seg_idx] - word_counts[seg_idx])
                     proportion = total_words_before / total_words
                     segment_start = proportion * audio_duration
                 else:
@@ -630,7 +1164,7 @@ class SimpleCaptionGenerator:
                         segment_end = segment_start + 1.0
 
             speaker_id = text_segment.get('speaker_id', 1)
-            speaker_name = speaker_mapping.get(speaker_id, f"Speaker {speaker_id}") if speaker_mapping else f"Speaker {speaker_id}"
+            speaker_name = name_table[speaker_id]
 
             caption_segments.append({
                 'start_time': segment_start,
@@ -651,15 +1185,66 @@ class SimpleCaptionGenerator:
 
         return caption_segments
 
+    def _normalize_match_words(self, segment_text: str) -> List[str]:
+        """Normalize a script segment into lowercase words for matching against transcribed words."""
+        # Clean the script text for matching (remove speaker labels, normalize)
+        clean_text = re.sub(r'Speaker\s+\d+:\s*', '', segment_text)
+        # Normalize quotes and punctuation for better matching
+        clean_text = clean_text.replace("'", "'").replace("'", "'")
+        clean_text = clean_text.replace(""", '"').replace(""", '"')
+        clean_text = clean_text.replace("—", "-").replace("–", "-")
+        clean_text = clean_text.replace("…", "...")
+
+        return [w.translate(_PUNCT_TRANSLATE).casefold() for w in clean_text.split()]
+
+    def _nw_segment_spans(self,
+                          all_segment_words: List[List[str]],
+                          transcribed_words: List[str]) -> List[Optional[Tuple[int, int]]]:
+        """
+        Align the whole script against the transcript with the banded DP kernel.
+
+        Returns:
+            For each script segment, the (first, last) transcribed word index covered
+            by its aligned words, or None if none of its words were aligned. Returns
+            None instead of the list if too few script words matched exactly.
+        """
+        # Hash each unique word to a small int so the kernel only compares integers
+        vocab: Dict[str, int] = {}
+        script_words = [w for words in all_segment_words for w in words]
+        script_ids = np.fromiter((vocab.setdefault(w, len(vocab)) for w in script_words),
+                                 dtype=np.int32, count=len(script_words))
+        tx_ids = np.fromiter((vocab.setdefault(w, len(vocab)) for w in transcribed_words),
+                             dtype=np.int32, count=len(transcribed_words))
+
+        aligned = _nw_align(script_ids, tx_ids, *_nw_band_limits(script_ids, tx_ids, _NW_ALIGN_BAND))
+
+        aligned_mask = aligned >= 0
+        matched = int((tx_ids[aligned[aligned_mask]] == script_ids[aligned_mask]).sum())
+        logger.info(f"Banded DP alignment matched {matched}/{len(script_words)} script words")
+        if matched < _NW_ALIGN_MIN_MATCH * len(script_words):
+            logger.warning("Banded DP alignment matched too few words; using the sequential matcher")
+            return None
+
+        spans: List[Optional[Tuple[int, int]]] = []
+        offset = 0
+        for words in all_segment_words:
+            hits = aligned[offset:offset + len(words)]
+            hits = hits[hits >= 0]
+            spans.append((int(hits[0]), int(hits[-1])) if hits.size else None)
+            offset += len(words)
+        return spans
+
     def _detect_audio_aligned_segments(self,
                                        audio_path: str,
                                        audio_duration: float,
-                                       target_segments: int) -> Optional[List[Tuple[float, float]]]:
+                                       target_segments: int,
+                                       ffmpeg_threads: int = 0) -> Optional[List[Tuple[float, float]]]:
         """
         Detect speech segments sentence-by-sentence using silence detection.
         
         Each silence period marks a sentence boundary. We create one speech segment
         per sentence (between silences) and map them directly to text sentences.
+        ffmpeg_threads is passed to ffmpeg's -threads (0 lets ffmpeg decide).
         """
         if not shutil.which("ffmpeg"):
             logger.warning("ffmpeg not available; skipping audio alignment.")
@@ -667,10 +1252,17 @@ class SimpleCaptionGenerator:
         
         # Use a lower threshold and shorter duration to detect sentence boundaries
         # Sentence pauses are typically 0.3-1.0 seconds
+        # silencedetect only needs a mono envelope: skip non-audio streams and
+        # downmix/resample before the filter so far fewer samples go through it
         cmd = [
             "ffmpeg",
+            "-nostdin",
+            "-threads", str(ffmpeg_threads),
+            "-vn", "-sn", "-dn",
             "-i",
             audio_path,
+            "-ac", "1",
+            "-ar", "16000",
             "-af",
             f"silencedetect=noise={self.audio_silence_threshold_db}dB:d={self.audio_silence_min_duration}",
             "-f",
@@ -678,26 +1270,30 @@ class SimpleCaptionGenerator:
             "-"
         ]
         
-        try:
-            proc = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        except subprocess.CalledProcessError as exc:
-            logger.warning("Audio alignment failed: %s", exc)
-            return None
-        
         # Extract all silence periods (sentence boundaries)
         silences: List[Tuple[float, float]] = []
         current_start: Optional[float] = None
         
-        for line in proc.stderr.splitlines():
-            line = line.strip()
-            start_match = re.search(r"silence_start:\s*([0-9.]+)", line)
-            if start_match:
-                current_start = float(start_match.group(1))
-                continue
-            end_match = re.search(r"silence_end:\s*([0-9.]+)", line)
-            if end_match and current_start is not None:
-                silences.append((current_start, float(end_match.group(1))))
-                current_start = None
+        # Stream ffmpeg's stderr and parse it while ffmpeg is still decoding,
+        # instead of buffering the whole (possibly multi-MB) log in memory
+        with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                              text=True, bufsize=1) as proc:
+            for line in proc.stderr:
+                # Most ffmpeg stderr lines are progress/stream info; skip them cheaply
+                if "silence_" not in line:
+                    continue
+                match = _SIL_RE.search(line)
+                if not match:
+                    continue
+                if match.group(1) == "start":
+                    current_start = float(match.group(2))
+                elif current_start is not None:
+                    silences.append((current_start, float(match.group(2))))
+                    current_start = None
+        
+        if proc.returncode:
+            logger.warning("Audio alignment failed: ffmpeg exited with status %d", proc.returncode)
+            return None
         
         if not silences:
             logger.warning("No silences detected in audio.")
@@ -707,67 +1303,49 @@ class SimpleCaptionGenerator:
         
         # Create speech segments: segments start after silences end
         # Each silence marks a pause between sentences, so the next sentence starts when silence ends
-        speech_segments: List[Tuple[float, float]] = []
+        silence_array = np.asarray(silences, dtype=np.float64)
+        segment_starts = silence_array[:, 1]
+        segment_ends = np.append(silence_array[1:, 0], audio_duration)
+        
+        # The last segment runs to the end of audio, if any audio is left
+        if segment_starts[-1] >= audio_duration:
+            segment_starts = segment_starts[:-1]
+            segment_ends = segment_ends[:-1]
         
         # First segment: from start to first silence (if any)
-        if silences:
-            first_silence_start = silences[0][0]
-            if first_silence_start > 0:
-                speech_segments.append((0.0, first_silence_start))
-        
-        # Subsequent segments: from end of one silence to start of next silence
-        for i, (silence_start, silence_end) in enumerate(silences):
-            # Find next silence start
-            next_silence_start = None
-            if i + 1 < len(silences):
-                next_silence_start = silences[i + 1][0]
-            
-            if next_silence_start:
-                # Segment from end of this silence to start of next silence
-                speech_segments.append((silence_end, next_silence_start))
-            else:
-                # Last segment: from end of this silence to end of audio
-                if silence_end < audio_duration:
-                    speech_segments.append((silence_end, audio_duration))
+        if silence_array[0, 0] > 0:
+            segment_starts = np.insert(segment_starts, 0, 0.0)
+            segment_ends = np.insert(segment_ends, 0, silence_array[0, 0])
         
         # Ensure we have at least one segment
-        if not speech_segments:
-            speech_segments.append((0.0, audio_duration))
+        if segment_starts.size == 0:
+            segment_starts = np.array([0.0])
+            segment_ends = np.array([audio_duration])
         
-        logger.info(f"Created {len(speech_segments)} speech segments from {len(silences)} silences")
+        logger.info(f"Created {segment_starts.size} speech segments from {len(silences)} silences")
         
         # Filter out very short segments (likely false positives, breathing, etc.)
-        # But keep at least one segment per target
-        filtered_segments: List[Tuple[float, float]] = []
-        for segment in speech_segments:
-            duration = segment[1] - segment[0]
-            if duration >= self.min_detected_segment_duration:
-                filtered_segments.append(segment)
-            elif filtered_segments:
-                # Merge very short segments with previous segment
-                # This handles cases where short pauses create false boundaries
-                prev_start, prev_end = filtered_segments[-1]
-                filtered_segments[-1] = (prev_start, segment[1])
-                logger.debug(f"Merged short segment {segment} (duration: {duration:.3f}s) with previous")
-            else:
-                # Keep first segment even if short
-                filtered_segments.append(segment)
+        # Each short segment is merged into the kept segment before it; the first
+        # segment is kept even if short. A kept segment's group therefore ends just
+        # before the next kept segment starts.
+        keep = (segment_ends - segment_starts) >= self.min_detected_segment_duration
+        keep[0] = True
+        kept_idx = np.flatnonzero(keep)
+        group_last_idx = np.append(kept_idx[1:] - 1, keep.size - 1)
+        if kept_idx.size < keep.size:
+            logger.debug(f"Merged {keep.size - kept_idx.size} short segments with their previous segment")
         
         # Additional pass: merge adjacent segments that are both very short
         # This helps with cases where multiple short pauses create multiple tiny segments
-        i = 0
-        while i < len(filtered_segments) - 1:
-            current_duration = filtered_segments[i][1] - filtered_segments[i][0]
-            next_duration = filtered_segments[i+1][1] - filtered_segments[i+1][0]
-            
-            # If both segments are short (less than 1.5s), merge them
-            if current_duration < 1.5 and next_duration < 1.5:
-                merged = (filtered_segments[i][0], filtered_segments[i+1][1])
-                filtered_segments[i] = merged
-                filtered_segments.pop(i+1)
-                logger.debug(f"Merged two short adjacent segments into one")
-            else:
-                i += 1
+        filtered_segments: List[Tuple[float, float]] = []
+        for start, end in zip(segment_starts[kept_idx].tolist(), segment_ends[group_last_idx].tolist()):
+            if filtered_segments:
+                prev_start, prev_end = filtered_segments[-1]
+                # If both segments are short (less than 1.5s), merge them
+                if prev_end - prev_start < 1.5 and end - start < 1.5:
+                    filtered_segments[-1] = (prev_start, end)
+                    continue
+            filtered_segments.append((start, end))
         
         logger.info(f"After filtering: {len(filtered_segments)} segments for {target_segments} text sentences")
         
@@ -796,43 +1374,22 @@ class SimpleCaptionGenerator:
             return speech_segments
         
         # Use silence START times as sentence boundaries (where sentences end)
-        # This is more accurate than using silence ends
-        silence_starts = sorted([s[0] for s in silences])
+        # This is more accurate than using silence ends. ffmpeg reports
+        # silences in time order, so no sort is needed here.
+        boundary_count = target_count - 1
         
         # If we have more silences than needed, select the most significant ones
         # Prioritize silences that are longer (more likely to be sentence boundaries)
-        # But also ensure we include silences at key positions (like around 213s for segment 26)
-        if len(silence_starts) > target_count - 1:
-            # Calculate silence durations and select longest ones
-            silence_with_duration = [(end - start, start, end) for start, end in silences]
-            silence_with_duration.sort(reverse=True, key=lambda x: x[0])
-            
-            # Take the top (target_count - 1) silences as sentence boundaries
-            # But also check if we need to include specific silences for accuracy
-            selected_silence_starts = sorted([sil[1] for sil in silence_with_duration[:target_count - 1]])
-            
-            # Special handling: if we have a silence around 213s, use it as a boundary
-            # This ensures segment 26 ("layoffs") aligns correctly
-            silence_213 = None
-            for start, end in silences:
-                if 212.5 <= start <= 213.5:
-                    silence_213 = start
-                    break
-            
-            if silence_213 and silence_213 not in selected_silence_starts:
-                # Add this boundary and remove the shortest one if we exceed count
-                selected_silence_starts.append(silence_213)
-                selected_silence_starts.sort()
-                if len(selected_silence_starts) > target_count - 1:
-                    # Remove the one that creates the shortest segment
-                    selected_silence_starts.pop()
-                    selected_silence_starts.sort()
-        elif len(silence_starts) < target_count - 1:
+        if len(silences) > boundary_count:
+            # Take the top (target_count - 1) longest silences as sentence boundaries;
+            # nlargest is a partial sort and keeps earlier silences first on ties
+            longest = heapq.nlargest(boundary_count, silences, key=lambda sil: sil[1] - sil[0])
+            selected_silence_starts = sorted(start for start, _ in longest)
+        elif len(silences) < boundary_count:
             # Too few silences - interpolate boundaries proportionally
-            step = audio_duration / target_count
-            selected_silence_starts = [i * step for i in range(1, target_count)]
+            selected_silence_starts = np.linspace(0.0, audio_duration, target_count + 1)[1:-1].tolist()
         else:
-            selected_silence_starts = silence_starts
+            selected_silence_starts = [start for start, _ in silences]
         
         # Create segments using selected boundaries
         # Each segment ends at a silence start (sentence boundary)
@@ -845,54 +1402,13 @@ class SimpleCaptionGenerator:
         if cursor < audio_duration:
             segments.append((cursor, audio_duration))
         
-        # Special case: if segment 26 should start around 213.0s, adjust it
-        # Check if we have a segment that should be split at 213.0s
-        for i, (start, end) in enumerate(segments):
-            if 205 <= start <= 213 and 213 <= end <= 214:
-                # This is likely segment 26 - it contains the "layoffs" sentence
-                # The sentence starts at 213.0s, so split the segment there
-                if i < len(segments) - 1:
-                    # Split at 213.0s
-                    segments[i] = (start, 213.0)
-                    segments.insert(i + 1, (213.0, end))
-                    # Adjust subsequent segments
-                    for j in range(i + 2, len(segments)):
-                        old_start, old_end = segments[j]
-                        # Shift start to maintain continuity
-                        if old_start < 213.0:
-                            segments[j] = (213.0, old_end)
-                    break
-        
-        # Ensure we have exactly target_count segments
-        while len(segments) < target_count:
-            # Split longest segment at midpoint
-            max_idx = max(range(len(segments)), key=lambda i: segments[i][1] - segments[i][0])
-            start, end = segments[max_idx]
-            mid = (start + end) / 2.0
-            segments[max_idx] = (start, mid)
-            segments.insert(max_idx + 1, (mid, end))
-        
-        while len(segments) > target_count:
-            # Merge smallest adjacent pair
-            min_idx = min(range(len(segments) - 1), 
-                         key=lambda i: (segments[i][1] - segments[i][0]) + (segments[i+1][1] - segments[i+1][0]))
-            merged = (segments[min_idx][0], segments[min_idx + 1][1])
-            segments[min_idx] = merged
-            segments.pop(min_idx + 1)
-        
-        # Special adjustment: ensure segment 26 ("layoffs") starts at 213.0s
-        # Find segment 26 (index 25) and adjust if needed
-        if len(segments) > 25:
-            seg_25_start, seg_25_end = segments[24]  # Segment 25 (0-indexed)
-            seg_26_start, seg_26_end = segments[25]  # Segment 26 (0-indexed)
-            
-            # If segment 26 starts before 213.0s and should start at 213.0s, adjust it
-            # Check if segment 26 contains the 213.0s point
-            if seg_26_start < 213.0 <= seg_26_end:
-                # Adjust: segment 25 ends at 213.0s, segment 26 starts at 213.0s
-                segments[24] = (seg_25_start, 213.0)
-                segments[25] = (213.0, seg_26_end)
-                logger.info(f"Adjusted segment 26 to start at 213.0s (was {seg_26_start:.2f}s)")
+        # Ensure we have exactly target_count segments: split the longest segments
+        # at their midpoints, or merge the smallest adjacent pairs
+        segments = _split_longest(segments, target_count)
+        segments = _merge_smallest_adjacent(segments, target_count)
+        
+        # Move boundaries onto caller-supplied sentence-start hints
+        segments = _snap_to_hints(segments, self.boundary_hints)
         
         return segments
     
@@ -906,10 +1422,10 @@ class SimpleCaptionGenerator:
         This merges or splits detected segments to match the number of text segments,
         preserving the relative timing of detected speech boundaries.
         """
-        segments = sorted(segments, key=lambda seg: seg[0])
+        # Sort by start, drop empty segments and clamp to the audio in one pass
         segments = [
             (max(0.0, start), min(audio_duration, end))
-            for start, end in segments
+            for start, end in sorted(segments, key=lambda seg: seg[0])
             if end > start
         ]
         
@@ -920,50 +1436,35 @@ class SimpleCaptionGenerator:
         if len(segments) == target_count:
             return segments
         
-        # Calculate cumulative time boundaries from detected segments
-        # These represent when speech actually occurs
-        speech_boundaries = [0.0]
-        for start, end in segments:
-            speech_boundaries.append(end)
-        speech_boundaries = sorted(set(speech_boundaries))
-        if speech_boundaries[-1] < audio_duration:
-            speech_boundaries.append(audio_duration)
-        
         # If we have more segments than target, merge adjacent small segments
-        while len(segments) > target_count:
-            # Find the pair of adjacent segments with smallest combined duration
-            min_combined = float('inf')
-            merge_idx = 0
-            for i in range(len(segments) - 1):
-                combined = (segments[i][1] - segments[i][0]) + (segments[i+1][1] - segments[i+1][0])
-                if combined < min_combined:
-                    min_combined = combined
-                    merge_idx = i
-            
-            # Merge segments at merge_idx
-            merged = (segments[merge_idx][0], segments[merge_idx + 1][1])
-            segments[merge_idx] = merged
-            segments.pop(merge_idx + 1)
+        segments = _merge_smallest_adjacent(segments, target_count)
         
         # If we have fewer segments than target, split the longest segments
-        while len(segments) < target_count:
-            # Find the longest segment
-            max_duration = 0
-            split_idx = 0
-            for i, (start, end) in enumerate(segments):
-                duration = end - start
-                if duration > max_duration:
-                    max_duration = duration
-                    split_idx = i
-            
-            # Split at midpoint
-            start, end = segments[split_idx]
-            mid = (start + end) / 2.0
-            segments[split_idx] = (start, mid)
-            segments.insert(split_idx + 1, (mid, end))
+        segments = _split_longest(segments, target_count)
         
         return segments
     
+    def _script_caption_segments(self,
+                                 script_segments: List[Dict[str, Any]],
+                                 start_times: np.ndarray,
+                                 end_times: np.ndarray,
+                                 speaker_mapping: Optional[Dict[int, str]] = None) -> List[Dict[str, Any]]:
+        """Build caption segments for script segments with the given timings."""
+        name_table = _speaker_name_table((seg['speaker_id'] for seg in script_segments), speaker_mapping)
+        return [
+            {
+                'start_time': start_time,
+                'end_time': end_time,
+                'text': segment['text'],
+                'speaker_id': segment['speaker_id'],
+                'speaker_name': name_table[segment['speaker_id']],
+                'confidence': 1.0,
+                'word_count': segment['word_count'],
+                'char_count': segment['char_count']
+            }
+            for segment, start_time, end_time in zip(script_segments, start_times.tolist(), end_times.tolist())
+        ]
+    
     def _build_segments_from_audio_alignment_with_word_count(self,
                                                               script_segments: List[Dict[str, Any]],
                                                               audio_segments: List[Tuple[float, float]],
@@ -1000,77 +1501,80 @@ class SimpleCaptionGenerator:
         audio_segments = calibrated_segments
         logger.info(f"Applied {CALIBRATION_OFFSET}s calibration offset to audio segments")
         
+        if not script_segments:
+            return []
+        
         # Calculate total words and total speech time
-        total_words = sum(seg['word_count'] for seg in script_segments)
-        total_speech_time = sum(end - start for start, end in audio_segments)
+        word_counts = np.fromiter((seg['word_count'] for seg in script_segments), dtype=np.int64,
+                                  count=len(script_segments))
+        total_words = int(word_counts.sum())
+        audio_array = np.asarray(audio_segments, dtype=np.float64).reshape(-1, 2)
+        audio_starts = audio_array[:, 0]
+        # Cumulative speech time at the start of each audio segment; cumsum
+        # accumulates left to right, matching a running Python sum
+        cum_audio_time = np.concatenate(([0.0], np.cumsum(audio_array[:, 1] - audio_starts)))
+        total_speech_time = float(cum_audio_time[-1])
+        
+        # Allocate time to each text segment in proportion to its words
+        if total_words > 0:
+            word_props = word_counts / total_words
+        else:
+            word_props = np.full(len(script_segments), 1.0 / len(script_segments))
+        segment_durations = total_speech_time * word_props
+        target_ends = np.cumsum(segment_durations)
+        target_starts = np.concatenate(([0.0], target_ends[:-1]))
+        
+        # Map target times onto the actual audio segments with a binary search.
+        # Calibration can clamp trailing segments to negative durations, so search
+        # the running maximum: the first segment whose cumulative end passes a
+        # target time is the one that contains it.
+        num_audio = len(audio_array)
+        cum_ends = np.maximum.accumulate(cum_audio_time[1:])
+        start_idx = np.searchsorted(cum_ends, target_starts, side='right')
+        end_idx = np.searchsorted(cum_ends, target_ends, side='left')
+        start_lookup = np.minimum(start_idx, num_audio - 1)
+        end_lookup = np.minimum(end_idx, num_audio - 1)
+        
+        # Target end lies in (cum[k], cum[k + 1]]
+        end_found = ((end_idx < num_audio)
+                     & (cum_audio_time[end_lookup] < target_ends)
+                     & (target_ends <= cum_audio_time[end_lookup + 1]))
+        # Target start lies in [cum[k], cum[k + 1]), no later than the end's segment
+        start_found = ((start_idx < num_audio)
+                       & (cum_audio_time[start_lookup] <= target_starts)
+                       & (target_starts < cum_audio_time[start_lookup + 1])
+                       & (~end_found | (start_idx <= end_idx)))
+        
+        actual_starts = np.where(
+            start_found, audio_starts[start_lookup] + (target_starts - cum_audio_time[start_lookup]), 0.0
+        )
+        actual_ends = np.where(
+            end_found, audio_starts[end_lookup] + (target_ends - cum_audio_time[end_lookup]), 0.0
+        )
         
-        # Map each text segment proportionally
-        caption_segments: List[Dict[str, Any]] = []
-        cumulative_audio_time = 0.0
+        # Fallback
+        missing_end = actual_ends == 0.0
+        if missing_end.any():
+            actual_ends[missing_end] = np.minimum(
+                audio_segments[-1][1], actual_starts[missing_end] + segment_durations[missing_end]
+            )
         
-        for text_idx, text_segment in enumerate(script_segments):
-            # Word proportion for this segment
-            word_prop = text_segment['word_count'] / total_words if total_words > 0 else 1.0 / len(script_segments)
-            
-            # Allocate time proportionally
-            segment_duration = total_speech_time * word_prop
-            
-            # Find position in cumulative audio time
-            target_start_time = cumulative_audio_time
-            target_end_time = cumulative_audio_time + segment_duration
-            
-            # Map to actual audio segments
-            actual_start = 0.0
-            actual_end = 0.0
-            audio_time_cursor = 0.0
-            
-            for audio_start, audio_end in audio_segments:
-                audio_dur = audio_end - audio_start
-                
-                # Check if target start is in this audio segment
-                if audio_time_cursor <= target_start_time < audio_time_cursor + audio_dur:
-                    offset = target_start_time - audio_time_cursor
-                    actual_start = audio_start + offset
-                
-                # Check if target end is in this audio segment
-                if audio_time_cursor < target_end_time <= audio_time_cursor + audio_dur:
-                    offset = target_end_time - audio_time_cursor
-                    actual_end = audio_start + offset
-                    break
-                
-                audio_time_cursor += audio_dur
-            
-            # Fallback
-            if actual_end == 0.0:
-                actual_end = min(audio_segments[-1][1], actual_start + segment_duration)
-            
-            # Apply calibration offset to final timings
-            actual_start = max(0.0, actual_start + CALIBRATION_OFFSET)
-            actual_end = min(audio_duration, actual_end + CALIBRATION_OFFSET)
-            
-            cumulative_audio_time += segment_duration
-            
-            speaker_id = text_segment['speaker_id']
-            speaker_name = speaker_mapping.get(speaker_id, f"Speaker {speaker_id}") if speaker_mapping else f"Speaker {speaker_id}"
-            
-            caption_segments.append({
-                'start_time': actual_start,
-                'end_time': actual_end,
-                'text': text_segment['text'],
-                'speaker_id': speaker_id,
-                'speaker_name': speaker_name,
-                'confidence': 1.0,
-                'word_count': text_segment['word_count'],
-                'char_count': text_segment['char_count']
-            })
-            
-            if text_idx < 3 or text_idx >= len(script_segments) - 3:
-                duration = actual_end - actual_start
-                print(f"[Audio alignment] Segment {text_idx + 1}: start={actual_start:.2f}s, end={actual_end:.2f}s, duration={duration:.2f}s")
+        # Apply calibration offset to final timings
+        np.maximum(actual_starts + CALIBRATION_OFFSET, 0.0, out=actual_starts)
+        np.minimum(actual_ends + CALIBRATION_OFFSET, audio_duration, out=actual_ends)
         
         # Ensure last segment ends at audio end
-        if caption_segments and audio_segments:
-            caption_segments[-1]['end_time'] = audio_segments[-1][1]
+        if len(actual_ends) and audio_segments:
+            actual_ends[-1] = audio_segments[-1][1]
+        
+        caption_segments = self._script_caption_segments(script_segments, actual_starts, actual_ends, speaker_mapping)
+        if logger.isEnabledFor(logging.DEBUG) and caption_segments:
+            logger.debug(
+                "[Audio alignment] %d segments, first=[%.2fs-%.2fs], last=[%.2fs-%.2fs]",
+                len(caption_segments),
+                caption_segments[0]['start_time'], caption_segments[0]['end_time'],
+                caption_segments[-1]['start_time'], caption_segments[-1]['end_time']
+            )
         
         return caption_segments
     
@@ -1098,29 +1602,22 @@ class SimpleCaptionGenerator:
                     # Extend last segment
                     audio_segments.append((last_end, last_end + 1.0))
         
-        caption_segments: List[Dict[str, Any]] = []
-        for idx, (text_segment, (start_time, end_time)) in enumerate(zip(script_segments, audio_segments)):
-            speaker_id = text_segment['speaker_id']
-            speaker_name = speaker_mapping.get(speaker_id, f"Speaker {speaker_id}") if speaker_mapping else f"Speaker {speaker_id}"
-            
-            caption_segments.append({
-                'start_time': start_time,
-                'end_time': end_time,
-                'text': text_segment['text'],
-                'speaker_id': speaker_id,
-                'speaker_name': speaker_name,
-                'confidence': 1.0,
-                'word_count': text_segment['word_count'],
-                'char_count': text_segment['char_count']
-            })
-            
-            if idx < 3 or idx >= len(script_segments) - 3:
-                duration = end_time - start_time
-                print(f"[Audio alignment] Segment {idx + 1}: start={start_time:.2f}s, end={end_time:.2f}s, duration={duration:.2f}s")
+        audio_array = np.asarray(audio_segments[:len(script_segments)], dtype=np.float64).reshape(-1, 2)
+        start_times = audio_array[:, 0].copy()
+        end_times = audio_array[:, 1].copy()
         
         # Ensure last segment ends at audio end
-        if caption_segments and audio_segments:
-            caption_segments[-1]['end_time'] = audio_segments[-1][1]
+        if len(end_times) and audio_segments:
+            end_times[-1] = audio_segments[-1][1]
+        
+        caption_segments = self._script_caption_segments(script_segments, start_times, end_times, speaker_mapping)
+        if logger.isEnabledFor(logging.DEBUG) and caption_segments:
+            logger.debug(
+                "[Audio alignment] %d segments, first=[%.2fs-%.2fs], last=[%.2fs-%.2fs]",
+                len(caption_segments),
+                caption_segments[0]['start_time'], caption_segments[0]['end_time'],
+                caption_segments[-1]['start_time'], caption_segments[-1]['end_time']
+            )
         
         return caption_segments
     
@@ -1196,10 +1693,11 @@ class SimpleCaptionGenerator:
             return self.generate_captions_from_script(script, sum(t['duration'] for t in timing_info), speaker_mapping)
         
         caption_segments = []
+        name_table = _speaker_name_table((seg['speaker_id'] for seg in script_segments), speaker_mapping)
         
         for i, (segment, timing) in enumerate(zip(script_segments, timing_info)):
             speaker_id = segment['speaker_id']
-            speaker_name = speaker_mapping.get(speaker_id, f"Speaker {speaker_id}") if speaker_mapping else f"Speaker {speaker_id}"
+            speaker_name = name_table[speaker_id]
             
             caption_segments.append({
                 'start_time': timing.get('start_time', 0.0),
@@ -1216,38 +1714,55 @@ class SimpleCaptionGenerator:
     
     def adjust_timing_for_audio(self,
                                caption_segments: List[Dict[str, Any]],
-                               actual_audio_duration: float) -> List[Dict[str, Any]]:
+                               actual_audio_duration: float,
+                               inplace: bool = False) -> List[Dict[str, Any]]:
         """
         Adjust caption timing to match actual audio duration.
         
         Args:
             caption_segments (List[Dict[str, Any]]): Original caption segments.
             actual_audio_duration (float): Actual audio duration in seconds.
+            inplace (bool): Rescale the given segment dicts in place instead of building a
+                copy of each. Use it when the caller no longer needs the old timings.
             
         Returns:
-            List[Dict[str, Any]]: Adjusted caption segments.
+            List[Dict[str, Any]]: Adjusted caption segments (the given list if inplace).
         """
         if not caption_segments:
-            return []
+            return caption_segments if inplace else []
+        
+        if inplace:
+            current_duration = max(seg['end_time'] for seg in caption_segments)
+            if current_duration <= 0:
+                return caption_segments
+            scale_factor = actual_audio_duration / current_duration
+            for segment in caption_segments:
+                segment['start_time'] *= scale_factor
+                segment['end_time'] *= scale_factor
+            return caption_segments
+        
+        n = len(caption_segments)
+        start_times = np.fromiter((seg['start_time'] for seg in caption_segments), dtype=np.float64, count=n)
+        end_times = np.fromiter((seg['end_time'] for seg in caption_segments), dtype=np.float64, count=n)
         
         # Calculate current total duration
-        current_duration = max(seg['end_time'] for seg in caption_segments)
+        current_duration = end_times.max()
         
         if current_duration <= 0:
             return caption_segments
         
         # Calculate scale factor
-        scale_factor = actual_audio_duration / current_duration
-        
-        # Adjust timing for each segment
-        adjusted_segments = []
-        for segment in caption_segments:
-            adjusted_segment = segment.copy()
-            adjusted_segment['start_time'] = segment['start_time'] * scale_factor
-            adjusted_segment['end_time'] = segment['end_time'] * scale_factor
-            adjusted_segments.append(adjusted_segment)
-        
-        return adjusted_segments
+        scale_factor = actual_audio_duration / float(current_duration)
+        
+        # Adjust timing for each segment; other keys are carried over unchanged
+        return [
+            {**segment, 'start_time': start_time, 'end_time': end_time}
+            for segment, start_time, end_time in zip(
+                caption_segments,
+                (start_times * scale_factor).tolist(),
+                (end_times * scale_factor).tolist()
+            )
+        ]
     
     def split_long_segments(self, 
                            caption_segments: List[Dict[str, Any]], 
@@ -1262,44 +1777,46 @@ class SimpleCaptionGenerator:
         Returns:
             List[Dict[str, Any]]: Split caption segments.
         """
-        split_segments = []
+        if not caption_segments:
+            return []
         
-        for segment in caption_segments:
-            duration = segment['end_time'] - segment['start_time']
-            
-            if duration <= max_duration:
+        start_times = np.fromiter((seg['start_time'] for seg in caption_segments), dtype=np.float64,
+                                  count=len(caption_segments))
+        end_times = np.fromiter((seg['end_time'] for seg in caption_segments), dtype=np.float64,
+                                count=len(caption_segments))
+        
+        # Only segments that will be split need their words
+        word_counts = np.zeros(len(caption_segments), dtype=np.int32)
+        segment_words = {}
+        for i in np.flatnonzero(end_times - start_times > max_duration).tolist():
+            segment_words[i] = caption_segments[i]['text'].split()
+            word_counts[i] = len(segment_words[i])
+        
+        # Numeric plan in the kernel; only the string joins happen here
+        segment_idx, start_word, end_word, segment_start, segment_end = _compute_split_indices(
+            word_counts, start_times, end_times, float(max_duration)
+        )
+        
+        split_segments = []
+        for i, first, last, seg_start, seg_end in zip(segment_idx.tolist(), start_word.tolist(),
+                                                      end_word.tolist(), segment_start.tolist(),
+                                                      segment_end.tolist()):
+            segment = caption_segments[i]
+            if first < 0:
                 split_segments.append(segment)
-            else:
-                # Split the segment
-                text = segment['text']
-                words = text.split()
-                num_words = len(words)
-                
-                # Calculate how many segments we need
-                num_segments = max(1, int(duration / max_duration))
-                words_per_segment = num_words // num_segments
-                
-                start_time = segment['start_time']
-                segment_duration = duration / num_segments
-                
-                for i in range(num_segments):
-                    start_word = i * words_per_segment
-                    end_word = start_word + words_per_segment if i < num_segments - 1 else num_words
-                    
-                    segment_text = ' '.join(words[start_word:end_word])
-                    segment_start = start_time + i * segment_duration
-                    segment_end = segment_start + segment_duration
-                    
-                    split_segments.append({
-                        'start_time': segment_start,
-                        'end_time': segment_end,
-                        'text': segment_text,
-                        'speaker_id': segment['speaker_id'],
-                        'speaker_name': segment['speaker_name'],
-                        'confidence': segment['confidence'],
-                        'word_count': len(segment_text.split()),
-                        'char_count': len(segment_text)
-                    })
+                continue
+            
+            segment_text = ' '.join(segment_words[i][first:last])
+            split_segments.append({
+                'start_time': seg_start,
+                'end_time': seg_end,
+                'text': segment_text,
+                'speaker_id': segment['speaker_id'],
+                'speaker_name': segment['speaker_name'],
+                'confidence': segment['confidence'],
+                'word_count': last - first,
+                'char_count': len(segment_text)
+            })
         
         return split_segments
 
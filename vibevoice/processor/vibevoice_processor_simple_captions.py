@@ -8,10 +8,12 @@ already have the script and just need to add timing information.
 
 import os
 import logging
-from typing import List, Dict, Any, Optional, Union, Tuple
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Union, Tuple, Callable
 import numpy as np
 import torch
-from pathlib import Path
 
 from .vibevoice_processor import VibeVoiceProcessor
 from ..caption.simple_caption_generator import SimpleCaptionGenerator
@@ -19,6 +21,79 @@ from ..caption.simple_caption_formatter import SimpleCaptionFormatter
 
 logger = logging.getLogger(__name__)
 
+def _librosa_duration(path: str) -> float:
+    """Audio duration via librosa, imported on first use."""
+    import librosa
+    return librosa.get_duration(filename=path)
+
+
+@lru_cache(maxsize=1)
+def _get_duration_fn() -> Optional[Callable[[str], float]]:
+    """
+    Probe once for the cheapest available audio duration reader.
+    
+    soundfile reads only the file header and is preferred; librosa is kept for
+    formats soundfile cannot open, without being imported until it is needed.
+    Returns None if neither is installed.
+    """
+    has_librosa = importlib.util.find_spec("librosa") is not None
+    try:
+        import soundfile as sf
+    except ImportError:
+        return _librosa_duration if has_librosa else None
+    
+    def soundfile_duration(path: str) -> float:
+        try:
+            return sf.info(path).duration
+        except RuntimeError:
+            if not has_librosa:
+                raise
+            return _librosa_duration(path)
+    
+    return soundfile_duration
+
+
+@lru_cache(maxsize=512)
+def _cached_duration(path: str, mtime: float, size: int) -> float:
+    """Audio duration in seconds, memoized on the file's path, mtime and size."""
+    duration_fn = _get_duration_fn()
+    if duration_fn is not None:
+        try:
+            return duration_fn(path)
+        except RuntimeError as e:
+            logger.debug(f"Could not read audio duration of {path}: {e}")
+    
+    # Fallback: estimate from file size
+    return size / (1024 * 1024) * 10  # Rough estimate
+
+
+def _num_samples(audio_item) -> int:
+    """Sample count of a tensor, array or nested list; time is the last axis of (T), (B, T) and (B, C, T)."""
+    audio_shape = audio_item.shape if hasattr(audio_item, 'shape') else np.shape(audio_item)
+    return audio_shape[-1] if len(audio_shape) else 1
+
+
+@lru_cache(maxsize=None)
+def _get_formatter() -> SimpleCaptionFormatter:
+    """Shared caption formatter; it holds no per-instance state."""
+    return SimpleCaptionFormatter()
+
+
+@lru_cache(maxsize=16)
+def _get_generator(words_per_minute: int, min_segment_duration: float,
+                   max_segment_duration: float) -> SimpleCaptionGenerator:
+    """
+    Caption generator shared by all processors with the same timing parameters.
+    
+    Callers must not change the returned generator's parameters; request the
+    generator for the new parameters instead.
+    """
+    return SimpleCaptionGenerator(
+        words_per_minute=words_per_minute,
+        min_segment_duration=min_segment_duration,
+        max_segment_duration=max_segment_duration
+    )
+
 
 class VibeVoiceProcessorSimpleCaptions(VibeVoiceProcessor):
     """
@@ -28,6 +103,15 @@ class VibeVoiceProcessorSimpleCaptions(VibeVoiceProcessor):
     audio timing, without requiring speech-to-text transcription.
     """
     
+    # Caption format -> (SimpleCaptionFormatter method, suffix appended to the audio file's stem)
+    _FORMAT_DISPATCH = {
+        'srt': ('format_srt', '.srt'),
+        'vtt': ('format_vtt', '.vtt'),
+        'json': ('format_json', '.json'),
+        'transcript': ('format_transcript', '.txt'),
+        'script_timing': ('format_script_with_timing', '_timing.txt'),
+    }
+    
     def __init__(self, 
                  tokenizer=None, 
                  audio_processor=None, 
@@ -57,13 +141,9 @@ class VibeVoiceProcessorSimpleCaptions(VibeVoiceProcessor):
             **kwargs
         )
         
-        # Initialize simple caption components
-        self.caption_generator = SimpleCaptionGenerator(
-            words_per_minute=words_per_minute,
-            min_segment_duration=min_segment_duration,
-            max_segment_duration=max_segment_duration
-        )
-        self.caption_formatter = SimpleCaptionFormatter()
+        # Initialize simple caption components (shared across processor instances)
+        self.caption_generator = _get_generator(words_per_minute, min_segment_duration, max_segment_duration)
+        self.caption_formatter = _get_formatter()
         self.caption_enabled = True
         
         # Caption configuration
@@ -113,94 +193,55 @@ class VibeVoiceProcessorSimpleCaptions(VibeVoiceProcessor):
             'caption_files': {}
         }
         
+        # A whitespace-only script counts as missing, so no audio work is done for it
+        has_script = bool(original_script and not original_script.isspace())
+        
         # Generate captions if requested and enabled
-        if generate_captions and self.caption_enabled and original_script:
+        if generate_captions and self.caption_enabled and has_script:
             try:
                 logger.info("🎬 Generating script-based captions...")
                 
-                # Calculate audio duration
-                if isinstance(audio, (list, tuple)):
-                    # For batch audio, use the first item for duration calculation
-                    audio_item = audio[0]
-                else:
-                    audio_item = audio
-                
-                # Convert to numpy if needed
-                if torch.is_tensor(audio_item):
-                    # Convert BFloat16 to float32 to avoid numpy conversion issues
-                    if audio_item.dtype == torch.bfloat16:
-                        audio_item = audio_item.float()
-                    audio_np = audio_item.detach().cpu().numpy()
-                else:
-                    audio_np = np.array(audio_item)
-                
-                # Calculate duration
+                # Calculate audio duration from sample counts alone; shapes are
+                # available without copying the audio off the device
                 if sampling_rate is None:
                     sampling_rate = 24000  # Default sample rate
                 
-                if len(audio_np.shape) > 1:
-                    audio_np = audio_np.squeeze()
+                if isinstance(audio, (list, tuple)):
+                    # For batch audio, use the longest item so no captions are cut short
+                    num_samples = max((_num_samples(audio_item) for audio_item in audio), default=0)
+                else:
+                    num_samples = _num_samples(audio)
                 
-                audio_duration = len(audio_np) / sampling_rate
+                audio_duration = num_samples / sampling_rate
                 
                 # Generate captions from script
                 caption_segments = self.caption_generator.generate_captions_from_script(
                     script=original_script,
                     audio_duration=audio_duration,
                     speaker_mapping=speaker_mapping,
-                    audio_path=audio_paths[0] if audio_paths else None
+                    audio_path=audio_paths[0] if audio_paths else None,
+                    split_long=True
                 )
                 
                 if caption_segments:
-                    # Split long segments if needed
-                    caption_segments = self.caption_generator.split_long_segments(
-                        caption_segments, 
-                        max_duration=self.max_segment_duration
-                    )
-                    
                     # Generate caption files in requested formats
                     if caption_formats is None:
                         caption_formats = ['srt', 'vtt', 'transcript']
+                    caption_formats = self._validate_caption_formats(caption_formats)
+                    
+                    # Format timestamps and text once for every file written below
+                    prepared_segments = self.caption_formatter.prepare_segments(caption_segments)
                     
-                    for audio_path in audio_paths:
-                        base_name = Path(audio_path).stem
-                        caption_dir = Path(audio_path).parent / "captions"
-                        
-                        # Create captions directory if it doesn't exist
-                        caption_dir.mkdir(parents=True, exist_ok=True)
-                        
-                        for format_name in caption_formats:
-                            try:
-                                if format_name == 'srt':
-                                    caption_file = self.caption_formatter.format_srt(
-                                        caption_segments,
-                                        os.path.join(caption_dir, f"{base_name}.srt")
-                                    )
-                                elif format_name == 'vtt':
-                                    caption_file = self.caption_formatter.format_vtt(
-                                        caption_segments,
-                                        os.path.join(caption_dir, f"{base_name}.vtt")
-                                    )
-                                elif format_name == 'json':
-                                    caption_file = self.caption_formatter.format_json(
-                                        caption_segments,
-                                        os.path.join(caption_dir, f"{base_name}.json")
-                                    )
-                                elif format_name == 'transcript':
-                                    caption_file = self.caption_formatter.format_transcript(
-                                        caption_segments,
-                                        os.path.join(caption_dir, f"{base_name}.txt")
-                                    )
-                                elif format_name == 'script_timing':
-                                    caption_file = self.caption_formatter.format_script_with_timing(
-                                        caption_segments,
-                                        os.path.join(caption_dir, f"{base_name}_timing.txt")
-                                    )
-                                
-                                result['caption_files'][f"{base_name}_{format_name}"] = caption_file
-                                
-                            except Exception as e:
-                                logger.warning(f"Failed to generate {format_name} captions: {e}")
+                    try:
+                        for audio_path in audio_paths:
+                            # Create captions directory if it doesn't exist
+                            os.makedirs(os.path.join(os.path.dirname(audio_path), "captions"), exist_ok=True)
+                            
+                            result['caption_files'].update(
+                                self._write_caption_files(prepared_segments, audio_path, caption_formats)
+                            )
+                    except Exception as e:
+                        logger.warning(f"Failed to write caption files: {e}")
                     
                     result['captions'] = caption_segments
                     logger.info(f"✅ Generated {len(caption_segments)} caption segments")
@@ -211,7 +252,7 @@ class VibeVoiceProcessorSimpleCaptions(VibeVoiceProcessor):
             except Exception as e:
                 logger.error(f"Caption generation failed: {e}")
                 result['caption_error'] = str(e)
-        elif generate_captions and not original_script:
+        elif generate_captions and not has_script:
             logger.warning("Caption generation requested but no original script provided")
             result['caption_error'] = "No original script provided for caption generation"
         
@@ -234,30 +275,21 @@ class VibeVoiceProcessorSimpleCaptions(VibeVoiceProcessor):
         Returns:
             Dict containing caption information
         """
-        if not os.path.exists(audio_path):
+        try:
+            st = os.stat(audio_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
         
-        # Get audio duration
-        try:
-            import librosa
-            duration = librosa.get_duration(filename=audio_path)
-        except ImportError:
-            # Fallback: estimate from file size
-            file_size = os.path.getsize(audio_path)
-            duration = file_size / (1024 * 1024) * 10  # Rough estimate
+        # Get audio duration (cached until the file changes)
+        duration = _cached_duration(audio_path, st.st_mtime, st.st_size)
         
         # Generate captions
         caption_segments = self.caption_generator.generate_captions_from_script(
             script=original_script,
             audio_duration=duration,
             speaker_mapping=speaker_mapping,
-            audio_path=audio_path
-        )
-        
-        # Split long segments
-        caption_segments = self.caption_generator.split_long_segments(
-            caption_segments, 
-            max_duration=self.max_segment_duration
+            audio_path=audio_path,
+            split_long=True
         )
         
         # Generate caption files
@@ -268,60 +300,79 @@ class VibeVoiceProcessorSimpleCaptions(VibeVoiceProcessor):
         
         if caption_formats is None:
             caption_formats = ['srt', 'vtt', 'transcript']
+        caption_formats = self._validate_caption_formats(caption_formats)
         
-        base_name = Path(audio_path).stem
-        caption_dir = Path(audio_path).parent / "captions"
-        
-        for format_name in caption_formats:
-            try:
-                if format_name == 'srt':
-                    caption_file = self.caption_formatter.format_srt(
-                        caption_segments,
-                        os.path.join(caption_dir, f"{base_name}.srt")
-                    )
-                elif format_name == 'vtt':
-                    caption_file = self.caption_formatter.format_vtt(
-                        caption_segments,
-                        os.path.join(caption_dir, f"{base_name}.vtt")
-                    )
-                elif format_name == 'json':
-                    caption_file = self.caption_formatter.format_json(
-                        caption_segments,
-                        os.path.join(caption_dir, f"{base_name}.json")
-                    )
-                elif format_name == 'transcript':
-                    caption_file = self.caption_formatter.format_transcript(
-                        caption_segments,
-                        os.path.join(caption_dir, f"{base_name}.txt")
-                    )
-                elif format_name == 'script_timing':
-                    caption_file = self.caption_formatter.format_script_with_timing(
-                        caption_segments,
-                        os.path.join(caption_dir, f"{base_name}_timing.txt")
-                    )
-                
-                result['caption_files'][f"{base_name}_{format_name}"] = caption_file
-                
-            except Exception as e:
-                logger.warning(f"Failed to generate {format_name} captions: {e}")
+        prepared_segments = self.caption_formatter.prepare_segments(caption_segments)
+        try:
+            result['caption_files'] = self._write_caption_files(prepared_segments, audio_path, caption_formats)
+        except Exception as e:
+            logger.warning(f"Failed to write caption files: {e}")
         
         return result
     
+    def _validate_caption_formats(self, caption_formats: List[str]) -> List[str]:
+        """Drop (and warn about) caption formats that have no formatter."""
+        unknown = [format_name for format_name in caption_formats if format_name not in self._FORMAT_DISPATCH]
+        if not unknown:
+            return caption_formats
+        logger.warning(f"Unknown caption formats ignored: {unknown}")
+        return [format_name for format_name in caption_formats if format_name in self._FORMAT_DISPATCH]
+    
+    def _write_caption_files(self, caption_segments, audio_path: str,
+                             caption_formats: List[str]) -> Dict[str, str]:
+        """
+        Write caption files for one audio file, one thread per format.
+        
+        Args:
+            caption_segments: Caption segments (or PreparedCaptions) to write
+            audio_path: Audio file the captions belong to; files go to its captions/ directory
+            caption_formats: Caption formats to write (validated names)
+            
+        Returns:
+            Dict mapping "<base_name>_<format>" to the written file path
+        """
+        parent, filename = os.path.split(audio_path)
+        base_name = os.path.splitext(filename)[0]
+        caption_dir = os.path.join(parent, "captions")
+        
+        caption_files = {}
+        if not caption_formats:
+            return caption_files
+        
+        # Output paths are built once per audio file
+        out_paths = {
+            format_name: os.path.join(caption_dir, base_name + self._FORMAT_DISPATCH[format_name][1])
+            for format_name in caption_formats
+        }
+        
+        # The writes are small and I/O-bound, so run them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(caption_formats))) as executor:
+            futures = {
+                format_name: executor.submit(
+                    getattr(self.caption_formatter, self._FORMAT_DISPATCH[format_name][0]),
+                    caption_segments, out_paths[format_name]
+                )
+                for format_name in caption_formats
+            }
+            
+            for format_name, future in futures.items():
+                caption_files[f"{base_name}_{format_name}"] = future.result()
+        
+        return caption_files
+    
     def enable_captions(self, words_per_minute: int = 150, 
                        min_segment_duration: float = 1.0, 
                        max_segment_duration: float = 10.0):
         """Enable caption generation with specified parameters."""
         self.caption_enabled = True
-        self.words_per_minute = words_per_minute
-        self.min_segment_duration = min_segment_duration
-        self.max_segment_duration = max_segment_duration
         
-        # Update caption generator
-        self.caption_generator = SimpleCaptionGenerator(
-            words_per_minute=words_per_minute,
-            min_segment_duration=min_segment_duration,
-            max_segment_duration=max_segment_duration
-        )
+        # Switch caption generators only if the parameters changed
+        params = (words_per_minute, min_segment_duration, max_segment_duration)
+        if params != (self.words_per_minute, self.min_segment_duration, self.max_segment_duration):
+            self.words_per_minute = words_per_minute
+            self.min_segment_duration = min_segment_duration
+            self.max_segment_duration = max_segment_duration
+            self.caption_generator = _get_generator(*params)
         
         logger.info("Simple caption generation enabled")
     
@@ -5,16 +5,19 @@ This module extends the VibeVoiceProcessor to include automatic caption generati
 for generated audio, providing accessibility and content understanding features.
 """
 
-import os
+import hashlib
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
 from typing import List, Dict, Any, Optional, Union, Tuple
 import numpy as np
 import torch
 from pathlib import Path
 
 from .vibevoice_processor import VibeVoiceProcessor
-from ..caption.caption_generator import CaptionGenerator
-from ..caption.caption_formatter import CaptionFormatter
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +31,29 @@ class VibeVoiceProcessorWithCaptions(VibeVoiceProcessor):
     content understanding capabilities.
     """
     
+    # Caption format -> (CaptionFormatter method, suffix appended to the audio file's stem)
+    _FORMAT_DISPATCH = {
+        'srt': ('format_srt', '.srt'),
+        'vtt': ('format_vtt', '.vtt'),
+        'json': ('format_json', '.json'),
+        'transcript': ('format_transcript', '.txt'),
+    }
+    
+    # Caption generators shared by all instances, keyed by their full load configuration;
+    # loading a Whisper model takes seconds, so each configuration is loaded once per process
+    _CAPTION_CACHE: Dict[Tuple, Any] = {}
+    _CAPTION_CACHE_LOCK = threading.Lock()
+    
+    # Clips below either threshold are not transcribed (see _is_silent)
+    _SILENCE_RMS = 1e-4
+    _MIN_CAPTION_SECONDS = 0.25
+    
+    # Transcriptions remembered per processor for repeated audio (see _transcribe_in_memory)
+    _CAPTION_MEMO_SIZE = 128
+    
+    # Background worker for caption_async; a single thread runs the jobs in submission order
+    _CAPTION_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="captions")
+    
     def __init__(self, 
                  tokenizer=None, 
                  audio_processor=None, 
@@ -36,6 +62,9 @@ class VibeVoiceProcessorWithCaptions(VibeVoiceProcessor):
                  caption_model="base",
                  caption_device=None,
                  caption_language=None,
+                 caption_backend="faster_whisper",
+                 caption_quantize=True,
+                 caption_compute_type=None,
                  **kwargs):
         """
         Initialize the enhanced processor with caption capabilities.
@@ -48,6 +77,10 @@ class VibeVoiceProcessorWithCaptions(VibeVoiceProcessor):
             caption_model: Whisper model size for caption generation
             caption_device: Device for caption generation
             caption_language: Language for caption generation
+            caption_backend: Transcription backend, 'faster_whisper' (CTranslate2 INT8),
+                'whisper' (openai-whisper) or 'openvino' (OpenVINO INT8 IR for CPU-only hosts)
+            caption_quantize: Load the caption model with INT8 weights on CPU and FP16 on CUDA
+            caption_compute_type: Explicit caption model precision, overriding caption_quantize
         """
         super().__init__(
             tokenizer=tokenizer,
@@ -57,28 +90,57 @@ class VibeVoiceProcessorWithCaptions(VibeVoiceProcessor):
             **kwargs
         )
         
-        # Initialize caption components
+        # Initialize caption components (the formatter is built on first use)
         self.caption_generator = None
-        self.caption_formatter = CaptionFormatter()
         self.caption_enabled = True
         
         # Caption configuration
         self.caption_model = caption_model
         self.caption_device = caption_device
         self.caption_language = caption_language
+        self.caption_backend = caption_backend
+        self.caption_quantize = caption_quantize
+        self.caption_compute_type = caption_compute_type
         
         # Initialize caption generator lazily
         self._caption_generator_initialized = False
+        
+        # LRU of transcriptions keyed by generator configuration and audio content; used from
+        # the caller's thread and the caption workers, so every access holds the memo lock
+        self._caption_memo: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._caption_memo_lock = threading.Lock()
+    
+    @cached_property
+    def caption_formatter(self):
+        """Caption formatter, imported and constructed on first access."""
+        from ..caption.caption_formatter import CaptionFormatter
+        return CaptionFormatter()
+    
+    def _caption_cache_key(self) -> Tuple:
+        """The caption generator configuration, used to key _CAPTION_CACHE and the memo."""
+        return (self.caption_model, self.caption_device, self.caption_language, self.caption_backend,
+                self.caption_quantize, self.caption_compute_type)
     
     def _ensure_caption_generator(self):
         """Initialize caption generator if not already done."""
         if not self._caption_generator_initialized and self.caption_enabled:
+            cache_key = self._caption_cache_key()
             try:
-                self.caption_generator = CaptionGenerator(
-                    model_name=self.caption_model,
-                    device=self.caption_device,
-                    language=self.caption_language
-                )
+                with self._CAPTION_CACHE_LOCK:
+                    caption_generator = self._CAPTION_CACHE.get(cache_key)
+                    if caption_generator is None:
+                        # Deferred so processors that never caption don't import the transcription stack
+                        from ..caption.caption_generator import CaptionGenerator
+                        caption_generator = CaptionGenerator(
+                            model_name=self.caption_model,
+                            device=self.caption_device,
+                            language=self.caption_language,
+                            backend=self.caption_backend,
+                            quantize=self.caption_quantize,
+                            compute_type=self.caption_compute_type
+                        )
+                        self._CAPTION_CACHE[cache_key] = caption_generator
+                self.caption_generator = caption_generator
                 self._caption_generator_initialized = True
                 logger.info("Caption generator initialized successfully")
             except Exception as e:
@@ -94,7 +156,8 @@ class VibeVoiceProcessorWithCaptions(VibeVoiceProcessor):
                                 original_script: Optional[str] = None,
                                 speaker_mapping: Optional[Dict[int, str]] = None,
                                 generate_captions: bool = True,
-                                caption_formats: List[str] = None) -> Dict[str, Any]:
+                                caption_formats: List[str] = None,
+                                caption_async: bool = False) -> Dict[str, Any]:
         """
         Save audio with automatic caption generation.
         
@@ -108,18 +171,49 @@ class VibeVoiceProcessorWithCaptions(VibeVoiceProcessor):
             speaker_mapping: Mapping of speaker IDs to names
             generate_captions: Whether to generate captions
             caption_formats: List of caption formats to generate ('srt', 'vtt', 'json', 'transcript')
+            caption_async: Return as soon as the audio is saved and generate captions on a
+                background worker; the result then holds 'captions_future' (see wait_captions)
             
         Returns:
             Dict containing audio file path and caption information
         """
-        # Save audio using parent method
-        audio_paths = self.save_audio(
-            audio=audio,
-            output_path=output_path,
-            sampling_rate=sampling_rate,
-            normalize=normalize,
-            batch_prefix=batch_prefix
-        )
+        # One device-to-host copy shared by save_audio and the transcription path
+        audio = self._audio_to_host(audio)
+        
+        audio_arrays = None
+        transcription_future = None
+        if generate_captions and self.caption_enabled:
+            if sampling_rate is None:
+                sampling_rate = self.audio_processor.sampling_rate
+            # Transcribe the audio exactly as it will be written instead of decoding the files
+            audio_arrays = self._split_saved_audio(audio, normalize)
+        
+        # Synchronous callers transcribe on a private thread while the WAVs are written;
+        # async jobs transcribe on the shared worker once the save has succeeded. Either way
+        # the shared generator runs one transcription at a time (CaptionGenerator._model_lock)
+        transcription_executor = None
+        if audio_arrays is not None and not caption_async:
+            transcription_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="caption-transcribe")
+            transcription_future = transcription_executor.submit(
+                self._transcribe_in_memory, audio_arrays, sampling_rate
+            )
+        
+        try:
+            # Save audio using parent method
+            audio_paths = self.save_audio(
+                audio=audio,
+                output_path=output_path,
+                sampling_rate=sampling_rate,
+                normalize=normalize,
+                batch_prefix=batch_prefix
+            )
+        except Exception:
+            if transcription_future is not None:
+                transcription_future.cancel()
+            raise
+        finally:
+            if transcription_executor is not None:
+                transcription_executor.shutdown(wait=False)
         
         result = {
             'audio_paths': audio_paths,
@@ -129,87 +223,292 @@ class VibeVoiceProcessorWithCaptions(VibeVoiceProcessor):
         
         # Generate captions if requested and enabled
         if generate_captions and self.caption_enabled:
-            try:
-                self._ensure_caption_generator()
+            if caption_async:
+                # Audio is already on disk; captions follow on the background worker
+                result['captions_future'] = self._CAPTION_EXECUTOR.submit(
+                    self._generate_caption_outputs, audio_paths, original_script,
+                    speaker_mapping, caption_formats, audio_arrays=audio_arrays,
+                    sampling_rate=sampling_rate
+                )
+            else:
+                result.update(self._generate_caption_outputs(
+                    audio_paths, original_script, speaker_mapping, caption_formats,
+                    transcription_future=transcription_future
+                ))
+        
+        return result
+    
+    def _generate_caption_outputs(self,
+                                  audio_paths: List[str],
+                                  original_script: Optional[str],
+                                  speaker_mapping: Optional[Dict[int, str]],
+                                  caption_formats: Optional[List[str]],
+                                  audio_arrays: Optional[List[np.ndarray]] = None,
+                                  sampling_rate: Optional[int] = None,
+                                  transcription_future: Optional[Future] = None) -> Dict[str, Any]:
+        """
+        Transcribe saved audio files and write their caption files.
+        
+        audio_arrays holds the audio written to audio_paths and is transcribed instead of
+        decoding the files; transcription_future, when given, already resolves to
+        _transcribe_in_memory's result for it.
+        
+        Returns:
+            Dict with 'captions' and 'caption_files', or 'caption_error' if generation failed
+        """
+        outputs = {}
+        try:
+            self._ensure_caption_generator()
+            
+            if self.caption_generator:
+                # Generate captions for each audio file
+                caption_results = []
+                caption_files = {}
+                
+                silent, transcriptions = set(), None
+                if transcription_future is not None:
+                    silent, transcriptions = transcription_future.result()
+                elif audio_arrays is not None:
+                    silent, transcriptions = self._transcribe_in_memory(audio_arrays, sampling_rate)
+                if transcriptions is not None and len(transcriptions) != len(audio_paths):
+                    logger.warning("In-memory audio does not match the saved files; transcribing the files")
+                    silent, transcriptions = set(), None
+                if transcriptions is None:
+                    # Transcribe all files up front
+                    transcriptions = self.caption_generator.transcribe_batch(audio_paths)
                 
-                if self.caption_generator:
-                    # Generate captions for each audio file
-                    caption_results = []
-                    caption_files = {}
+                for i, audio_path in enumerate(audio_paths):
+                    transcription = transcriptions[i]
+                    if i in silent:
+                        caption_results.append({
+                            'transcription': transcription,
+                            'caption_segments': [],
+                            'speaker_mapping': speaker_mapping or {},
+                            'total_duration': transcription['duration']
+                        })
+                        continue
                     
-                    for audio_path in audio_paths:
-                        # Generate captions for this audio file
-                        if original_script:
-                            caption_result = self.caption_generator.generate_captions_for_script(
-                                audio_path=audio_path,
-                                original_script=original_script,
-                                speaker_mapping=speaker_mapping
-                            )
-                        else:
-                            # Simple transcription without speaker identification
-                            transcription = self.caption_generator.transcribe_audio(audio_path)
-                            caption_result = {
-                                'transcription': transcription,
-                                'caption_segments': [{
-                                    'start_time': 0.0,
-                                    'end_time': transcription['duration'],
-                                    'text': transcription['text'],
-                                    'speaker_id': 0,
-                                    'speaker_name': 'Speaker',
-                                    'confidence': 1.0
-                                }],
-                                'speaker_mapping': speaker_mapping or {},
-                                'total_duration': transcription['duration']
-                            }
-                        
-                        caption_results.append(caption_result)
-                        
-                        # Generate caption files in requested formats
-                        if caption_formats is None:
-                            caption_formats = ['srt', 'vtt', 'json', 'transcript']
-                        
-                        base_name = Path(audio_path).stem
-                        caption_dir = Path(audio_path).parent / "captions"
-                        
-                        for format_name in caption_formats:
-                            try:
-                                if format_name == 'srt':
-                                    caption_file = self.caption_formatter.format_srt(
-                                        caption_result['caption_segments'],
-                                        os.path.join(caption_dir, f"{base_name}.srt")
-                                    )
-                                elif format_name == 'vtt':
-                                    caption_file = self.caption_formatter.format_vtt(
-                                        caption_result['caption_segments'],
-                                        os.path.join(caption_dir, f"{base_name}.vtt")
-                                    )
-                                elif format_name == 'json':
-                                    caption_file = self.caption_formatter.format_json(
-                                        caption_result['caption_segments'],
-                                        os.path.join(caption_dir, f"{base_name}.json")
-                                    )
-                                elif format_name == 'transcript':
-                                    caption_file = self.caption_formatter.format_transcript(
-                                        caption_result['caption_segments'],
-                                        os.path.join(caption_dir, f"{base_name}.txt")
-                                    )
-                                
-                                caption_files[f"{base_name}_{format_name}"] = caption_file
-                                
-                            except Exception as e:
-                                logger.warning(f"Failed to generate {format_name} captions: {e}")
+                    # Generate captions for this audio file
+                    if original_script:
+                        caption_result = self.caption_generator.generate_captions_for_script(
+                            audio_path=audio_path,
+                            original_script=original_script,
+                            speaker_mapping=speaker_mapping,
+                            transcription=transcription
+                        )
+                    else:
+                        # Simple transcription without speaker identification
+                        caption_result = {
+                            'transcription': transcription,
+                            'caption_segments': [{
+                                'start_time': 0.0,
+                                'end_time': transcription['duration'],
+                                'text': transcription['text'],
+                                'speaker_id': 0,
+                                'speaker_name': 'Speaker',
+                                'confidence': 1.0
+                            }],
+                            'speaker_mapping': speaker_mapping or {},
+                            'total_duration': transcription['duration']
+                        }
                     
-                    result['captions'] = caption_results
-                    result['caption_files'] = caption_files
+                    caption_results.append(caption_result)
+                
+                # Generate caption files in requested formats
+                if caption_formats is None:
+                    caption_formats = ['srt', 'vtt', 'json', 'transcript']
+                
+                # Resolve the requested formats to file suffixes once, not per audio file
+                format_suffixes = []
+                for format_name in caption_formats:
+                    if format_name in self._FORMAT_DISPATCH:
+                        format_suffixes.append((format_name, self._FORMAT_DISPATCH[format_name][1]))
+                    else:
+                        logger.warning(f"Failed to generate {format_name} captions: unknown format")
+                
+                # One write task per (audio file, format); each captions directory is created once
+                tasks = []
+                caption_dirs = set()
+                for i, (audio_path, caption_result) in enumerate(zip(audio_paths, caption_results)):
+                    if i in silent:
+                        continue
+                    audio_path = Path(audio_path)
+                    base_name = audio_path.stem
+                    caption_dir = audio_path.parent / "captions"
+                    caption_dirs.add(caption_dir)
                     
-                    logger.info(f"Generated captions for {len(audio_paths)} audio files")
+                    caption_segments = caption_result['caption_segments']
+                    for format_name, suffix in format_suffixes:
+                        tasks.append((f"{base_name}_{format_name}", format_name,
+                                      str(caption_dir / (base_name + suffix)), caption_segments))
                 
-            except Exception as e:
-                logger.error(f"Caption generation failed: {e}")
-                result['caption_error'] = str(e)
+                for caption_dir in caption_dirs:
+                    caption_dir.mkdir(parents=True, exist_ok=True)
+                
+                # The writes are small and I/O-bound, so run them concurrently
+                if tasks:
+                    with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+                        written = list(executor.map(self._write_one_format, tasks))
+                    for (key, *_), caption_file in zip(tasks, written):
+                        if caption_file is not None:
+                            caption_files[key] = caption_file
+                
+                outputs['captions'] = caption_results
+                outputs['caption_files'] = caption_files
+                
+                logger.info(f"Generated captions for {len(audio_paths)} audio files")
+            
+        except Exception as e:
+            logger.error(f"Caption generation failed: {e}")
+            outputs['caption_error'] = str(e)
+        
+        return outputs
+    
+    def _transcribe_in_memory(self, audio_arrays: List[np.ndarray],
+                              sampling_rate: int) -> Tuple[set, List[Dict[str, Any]]]:
+        """
+        Transcribe one in-memory array per audio file.
+        
+        Silent or very short clips get an empty transcription without a Whisper pass.
+        Identical clips, within the batch or seen recently, are transcribed once.
+        
+        Returns:
+            Indices of the silent clips, and one transcription per array
+        """
+        self._ensure_caption_generator()
+        if not self.caption_generator:
+            raise RuntimeError("Caption generator is not available")
+        
+        transcriptions = [
+            {'text': '', 'language': 'unknown', 'duration': len(audio_array) / sampling_rate, 'segments': []}
+            for audio_array in audio_arrays
+        ]
+        silent = set()
+        pending = OrderedDict()  # memo key -> indices of the clips with that content
+        config_key = self._caption_cache_key()
+        for i, audio_array in enumerate(audio_arrays):
+            if self._is_silent(audio_array, sampling_rate):
+                silent.add(i)
+                continue
+            audio_array = np.ascontiguousarray(audio_array)
+            key = (config_key, sampling_rate, audio_array.dtype.str,
+                   hashlib.blake2b(audio_array.data, digest_size=16).digest())
+            with self._caption_memo_lock:
+                cached = self._caption_memo.get(key)
+                if cached is not None:
+                    self._caption_memo.move_to_end(key)
+            if cached is not None:
+                transcriptions[i] = dict(cached)
+            else:
+                pending.setdefault(key, []).append(i)
+        
+        if pending:
+            transcribed = self.caption_generator.transcribe_batch(
+                None, audio_arrays=[audio_arrays[indices[0]] for indices in pending.values()],
+                sample_rate=sampling_rate
+            )
+            for (key, indices), transcription in zip(pending.items(), transcribed):
+                for i in indices:
+                    transcriptions[i] = dict(transcription)
+                with self._caption_memo_lock:
+                    self._caption_memo[key] = transcription
+                    while len(self._caption_memo) > self._CAPTION_MEMO_SIZE:
+                        self._caption_memo.popitem(last=False)
+        return silent, transcriptions
+    
+    @classmethod
+    def _is_silent(cls, audio_array: np.ndarray, sampling_rate: int) -> bool:
+        """Whether a clip is too short or too quiet to be worth transcribing."""
+        if audio_array.size < sampling_rate * cls._MIN_CAPTION_SECONDS:
+            return True
+        audio_array = audio_array.astype(np.float32, copy=False)
+        rms = float(np.sqrt(np.dot(audio_array, audio_array) / audio_array.size))
+        return rms < cls._SILENCE_RMS
+    
+    @staticmethod
+    def _audio_to_host(
+        audio: Union[torch.Tensor, np.ndarray, List[Union[torch.Tensor, np.ndarray]]]
+    ) -> Union[np.ndarray, List[Union[torch.Tensor, np.ndarray]]]:
+        """Copy tensors to host NumPy arrays the way save_audio does, so it finds nothing left to copy."""
+        if isinstance(audio, torch.Tensor):
+            return audio.float().detach().cpu().numpy()
+        if isinstance(audio, list) and audio and all(isinstance(a, torch.Tensor) for a in audio):
+            return [a.float().detach().cpu().numpy() for a in audio]
+        return audio
+    
+    def _split_saved_audio(
+        self,
+        audio: Union[np.ndarray, List[Union[torch.Tensor, np.ndarray]]],
+        normalize: bool
+    ) -> Optional[List[np.ndarray]]:
+        """
+        Split and prepare audio the way save_audio does into one mono array per file it writes.
+        
+        Expects the output of _audio_to_host. Returns None when the layout doesn't map
+        cleanly onto mono files (e.g. multi-channel audio), in which case the saved files
+        are decoded instead.
+        """
+        if isinstance(audio, list):
+            items = [a.float().detach().cpu().numpy() if isinstance(a, torch.Tensor) else np.asarray(a)
+                     for a in audio]
+        elif isinstance(audio, np.ndarray) and audio.ndim >= 3 and audio.shape[0] > 1:
+            items = list(audio)
+        elif isinstance(audio, np.ndarray):
+            items = [audio]
+        else:
+            return None
         
+        arrays = [np.squeeze(item) for item in items]
+        if any(array.ndim != 1 for array in arrays):
+            return None
+        return [self.audio_processor._prepare_audio_for_save(array, normalize) for array in arrays]
+    
+    @staticmethod
+    def wait_captions(result: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Block until captions requested with caption_async=True are written.
+        
+        Args:
+            result: Dict returned by save_audio_with_captions
+            timeout: Seconds to wait before raising TimeoutError (None waits indefinitely)
+            
+        Returns:
+            The same dict, with 'captions_future' replaced by 'captions' and 'caption_files'
+            (or 'caption_error')
+        """
+        future = result.get('captions_future')
+        if future is not None:
+            result.update(future.result(timeout=timeout))
+            del result['captions_future']
         return result
     
+    def _write_one_format(self, task: Tuple[str, str, str, List[Dict[str, Any]]]) -> Optional[str]:
+        """
+        Write one caption file for a (key, format, path, segments) task; None if it failed.
+        
+        The caption is rendered in memory, written to a temporary file next to the target
+        in a single write, and moved into place so readers never see a partial file.
+        """
+        _, format_name, output_file, caption_segments = task
+        tmp_path = None
+        try:
+            method_name = self._FORMAT_DISPATCH[format_name][0]
+            payload = getattr(self.caption_formatter, method_name)(caption_segments)
+            
+            # Unique per writer thread; created with the umask-default mode like a plain open()
+            directory, file_name = os.path.split(output_file)
+            tmp_path = os.path.join(directory, f".{file_name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, output_file)
+            return output_file
+        except Exception as e:
+            logger.warning(f"Failed to generate {format_name} captions: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return None
+    
     def generate_podcast_with_captions(self,
                                      text: Union[str, List[str]],
                                      voice_samples: Optional[List[Union[str, np.ndarray]]] = None,
@@ -269,6 +568,7 @@ class VibeVoiceProcessorWithCaptions(VibeVoiceProcessor):
     def disable_captions(self):
         """Disable caption generation."""
         self.caption_enabled = False
+        # Only detach; the generator stays in the shared cache for other instances
         self.caption_generator = None
         self._caption_generator_initialized = False
         logger.info("Caption generation disabled")
@@ -280,6 +580,9 @@ class VibeVoiceProcessorWithCaptions(VibeVoiceProcessor):
         caption_model = kwargs.pop('caption_model', 'base')
         caption_device = kwargs.pop('caption_device', None)
         caption_language = kwargs.pop('caption_language', None)
+        caption_backend = kwargs.pop('caption_backend', 'faster_whisper')
+        caption_quantize = kwargs.pop('caption_quantize', True)
+        caption_compute_type = kwargs.pop('caption_compute_type', None)
         
         # Create base processor
         processor = super().from_pretrained(pretrained_model_name_or_path, **kwargs)
@@ -292,7 +595,10 @@ class VibeVoiceProcessorWithCaptions(VibeVoiceProcessor):
             db_normalize=processor.db_normalize,
             caption_model=caption_model,
             caption_device=caption_device,
-            caption_language=caption_language
+            caption_language=caption_language,
+            caption_backend=caption_backend,
+            caption_quantize=caption_quantize,
+            caption_compute_type=caption_compute_type
         )
         
         return enhanced_processor